@@ -119,8 +119,8 @@ def main():
     ris_file = OUTPUT_DIR / "references.ris"
     csv_file = OUTPUT_DIR / "papers.csv"
     
-    searcher.generate_bibliography(papers, format="bibtex", output_file=str(bib_file))
-    searcher.generate_bibliography(papers, format="ris", output_file=str(ris_file))
+    searcher.generate_bibliography(papers, format="bibtex", output_file=str(bib_file), return_text=False)
+    searcher.generate_bibliography(papers, format="ris", output_file=str(ris_file), return_text=False)
     searcher.export_to_csv(papers, output_file=str(csv_file))
     
     print(f"✓ BibTeX: {bib_file}")
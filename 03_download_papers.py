@@ -5,6 +5,7 @@ Download PDFs for papers from bibliography file using multiple strategies.
 
 Usage:
     python 03_download_papers.py
+    python 03_download_papers.py --retry-failed   # also retry recent failures
 
 Configuration:
     Set UNPAYWALL_EMAIL in .env file (see .env.example)
@@ -31,6 +32,9 @@ default = Path("results/references.bib")
 BIB_FILE = filtered if filtered.exists() else default
 OUTPUT_DIR = Path("results/pdfs")
 USE_SCIHUB = False  # Set to True to enable Sci-Hub fallback (use responsibly)
+# Papers that failed with the same sources in the last 7 days are skipped;
+# set to True (or pass --retry-failed) to try them again
+RETRY_FAILED = "--retry-failed" in sys.argv[1:]
 
 def main():
     """Main execution function"""
@@ -64,6 +68,7 @@ def main():
     print(f"Output directory: {OUTPUT_DIR}")
     print(f"Unpaywall email: {unpaywall_email or 'Not set'}")
     print(f"Sci-Hub enabled: {USE_SCIHUB}")
+    print(f"Retry recent failures: {RETRY_FAILED}")
     print()
     
     # Create downloader
@@ -75,11 +80,13 @@ def main():
     downloader = PaperDownloader(
         output_dir=str(OUTPUT_DIR),
         use_scihub=USE_SCIHUB,
-        unpaywall_email=unpaywall_email
+        unpaywall_email=unpaywall_email,
+        retry_failed=RETRY_FAILED
     )
     
     # Download papers
     downloader.download_from_bib(str(BIB_FILE))
+    downloader.close()
     
     # Get failed papers and save to CSV and BIB
     failed_papers = downloader.get_failed_papers()
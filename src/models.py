@@ -1,22 +1,55 @@
 """
-Simple data models for papers, authors, and publications.
+Simple data models for papers and publications.
 No complexity - just what we need to store and export data.
 """
 
+import re
+import sys
+import unicodedata
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import AbstractSet, Iterable, List, Optional, Set, Tuple
 from datetime import date
 
 
-@dataclass
-class Author:
-    """Represents a paper author"""
-    name: str
-    affiliation: Optional[str] = None
-    email: Optional[str] = None
+# Anything but letters and digits of any script (\W also matches "_")
+_TITLE_PUNCT_RE = re.compile(r'[\W_]+')
 
+# Single-pass brace removal for BibTeX abstracts
+_BIB_ABSTRACT_TRANS = str.maketrans('', '', '{}')
 
-@dataclass
+# BibTeX special characters not already escaped (abstracts that went through
+# LaTeX often contain \% or \&; escaping those again would give \\%)
+_BIB_SPECIAL_CHAR_RE = re.compile(r'(?<!\\)([%&$#_])')
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Shared default for papers without keywords (replaced by a set on first add)
+_NO_KEYWORDS: AbstractSet[str] = frozenset()
+
+
+def _normalize_title(title: str) -> str:
+    """
+    Fold a title into a comparison key for deduplication.
+    
+    Strips diacritics (combining marks only), casefolds, replaces punctuation
+    with spaces and collapses whitespace, so "Müller et al." and "Muller et
+    al" match. Letters of other scripts (Greek, Cyrillic, CJK) are kept, so
+    "α-Synuclein" and "β-Synuclein" stay different.
+    
+    Args:
+        title: Title to normalize
+    
+    Returns:
+        Normalized title key
+    """
+    decomposed = unicodedata.normalize('NFKD', title)
+    folded = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn').casefold()
+    key = ' '.join(_TITLE_PUNCT_RE.sub(' ', folded).split())
+    return key or title.lower().strip()
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Paper:
     """
     Represents a scientific paper with all metadata needed for 
@@ -38,13 +71,23 @@ class Paper:
     isbn: Optional[str] = None
     url: Optional[str] = None
     pdf_url: Optional[str] = None
-    keywords: Set[str] = field(default_factory=set)
+    keywords: AbstractSet[str] = _NO_KEYWORDS  # Use add_keywords() to add terms
     citations: Optional[int] = None
     sources: Set[str] = field(default_factory=set)  # Which databases found this paper
+    _title_key: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def title_key(self) -> str:
+        """Normalized title used for deduplication (recomputed only if title changes)"""
+        cached = self._title_key
+        if cached is None or cached[0] is not self.title:
+            cached = (self.title, _normalize_title(self.title))
+            self._title_key = cached
+        return cached[1]
     
     def __hash__(self):
-        """Hash based on title for deduplication"""
-        return hash(self.title.lower().strip())
+        """Hash based on normalized title for deduplication"""
+        return hash(self.title_key)
     
     def __eq__(self, other):
         """Papers are equal if they have the same title or same DOI"""
@@ -55,8 +98,20 @@ class Paper:
         if self.doi and other.doi:
             return self.doi.lower() == other.doi.lower()
         
-        # Otherwise use title
-        return self.title.lower().strip() == other.title.lower().strip()
+        # Otherwise use normalized title
+        return self.title_key == other.title_key
+    
+    def cite_key_base(self) -> str:
+        """
+        Default citation key: FirstAuthorLastName_Year, or "Unknown".
+        
+        Returns:
+            Citation key without any disambiguation suffix
+        """
+        if self.authors and self.publication_date:
+            last_name = self.authors[0].split()[-1]
+            return f"{last_name}_{self.publication_date.year}"
+        return "Unknown"
     
     def to_bibtex_entry(self, cite_key: Optional[str] = None) -> str:
         """
@@ -69,52 +124,54 @@ class Paper:
             BibTeX formatted string
         """
         if cite_key is None:
-            # Generate cite key: FirstAuthorLastName_Year
-            if self.authors and self.publication_date:
-                first_author = self.authors[0].split()[-1]  # Get last name
-                cite_key = f"{first_author}_{self.publication_date.year}"
-            else:
-                cite_key = "Unknown"
+            cite_key = self.cite_key_base()
         
         # Determine entry type
         entry_type = "article"  # Default
         if self.arxiv_id:
             entry_type = "misc"
         
-        lines = [f"@{entry_type}{{{cite_key},"]
-        
-        # Add fields
-        if self.title:
-            lines.append(f'  title = {{{self.title}}},')
-        if self.authors:
-            authors_str = ' and '.join(self.authors)
-            lines.append(f'  author = {{{authors_str}}},')
-        if self.journal:
-            lines.append(f'  journal = {{{self.journal}}},')
-        if self.publication_date:
-            lines.append(f'  year = {{{self.publication_date.year}}},')
-        if self.volume:
-            lines.append(f'  volume = {{{self.volume}}},')
-        if self.issue:
-            lines.append(f'  number = {{{self.issue}}},')
-        if self.pages:
-            lines.append(f'  pages = {{{self.pages}}},')
-        if self.doi:
-            lines.append(f'  doi = {{{self.doi}}},')
-        if self.url:
-            lines.append(f'  url = {{{self.url}}},')
-        if self.pmid:
-            lines.append(f'  pmid = {{{self.pmid}}},')
-        if self.arxiv_id:
-            lines.append(f'  arxiv_id = {{{self.arxiv_id}}},')
-        if self.abstract:
+        # Field values in output order; empty values are skipped
+        fields = (
+            ('title', self.title),
+            ('author', ' and '.join(self.authors)),
+            ('journal', self.journal),
+            ('year', self.publication_date.year if self.publication_date else None),
+            ('volume', self.volume),
+            ('number', self.issue),
+            ('pages', self.pages),
+            ('doi', self.doi),
+            ('url', self.url),
+            ('pmid', self.pmid),
+            ('arxiv_id', self.arxiv_id),
             # Clean abstract for BibTeX
-            clean_abstract = self.abstract.replace('{', '').replace('}', '')
-            lines.append(f'  abstract = {{{clean_abstract}}},')
+            ('abstract', _BIB_SPECIAL_CHAR_RE.sub(r'\\\1', self.abstract.translate(_BIB_ABSTRACT_TRANS))
+                         if self.abstract else None),
+        )
         
+        lines = ['@%s{%s,' % (entry_type, cite_key)]
+        lines.extend(['  %s = {%s},' % (name, value) for name, value in fields if value])
         lines.append("}")
         return '\n'.join(lines)
     
+    def add_keywords(self, terms: Iterable[str]):
+        """
+        Add keywords to this paper, skipping empty terms.
+        
+        Papers start with a shared empty frozenset; a private set is only
+        allocated once there is something to store.
+        
+        Args:
+            terms: Keywords to add
+        """
+        new_terms = {term for term in terms if term}
+        if not new_terms:
+            return
+        if isinstance(self.keywords, set):
+            self.keywords.update(new_terms)
+        else:
+            self.keywords = new_terms | self.keywords
+    
     def merge_with(self, other: 'Paper'):
         """
         Merge data from another paper object (for deduplication).
@@ -166,7 +223,7 @@ class Paper:
             self.pdf_url = other.pdf_url
         
         # Merge collections
-        self.keywords.update(other.keywords)
+        self.add_keywords(other.keywords)
         self.sources.update(other.sources)
         
         # Take higher citation count
@@ -3,20 +3,167 @@ Main paper searcher - coordinates all search sources and provides unified interf
 """
 
 import logging
-from typing import List, Dict, Optional, Set
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Callable, List, Dict, Iterator, Optional, Set, Tuple
 from datetime import datetime, date
 from pathlib import Path
 
 from .models import Paper
 from .config import Config
-from .searchers.scopus_searcher import ScopusSearcher
-from .searchers.pubmed_searcher import PubMedSearcher
-from .searchers.arxiv_searcher import ArxivSearcher
-from .searchers.ieee_searcher import IEEESearcher
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 
 logger = logging.getLogger(__name__)
 
+# Retry policy mounted for export.arxiv.org on the shared session (same as
+# arxiv_searcher's own, which is not imported here so lxml stays optional)
+_ARXIV_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504)
+)
+
+# Minimum similarity for two normalized titles to count as the same paper
+FUZZY_TITLE_THRESHOLD = 0.95
+
+# Numbers in a normalized title (years, part/volume numbers)
+_TITLE_NUMBER_RE = re.compile(r'\d+')
+
+# Words skipped when choosing a title's blocking token
+_TITLE_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'of', 'on', 'in', 'for', 'and', 'or', 'to', 'with',
+    'from', 'by', 'at', 'as', 'via', 'is', 'are', 'towards', 'toward',
+})
+
+
+def _title_block_key(title_key: str) -> str:
+    """
+    Blocking key for fuzzy title matching: first significant word of the title.
+    
+    Only titles sharing a block key are compared, which keeps near-duplicate
+    detection at O(N * block size) instead of O(N^2).
+    
+    Args:
+        title_key: Normalized title (see Paper.title_key)
+    
+    Returns:
+        Block key string
+    """
+    for word in title_key.split():
+        if word not in _TITLE_STOPWORDS:
+            return word
+    return title_key
+
+
+def _identifiers_conflict(a: Paper, b: Paper) -> bool:
+    """
+    Check whether two papers carry different values for the same identifier.
+    
+    DOI, PMID and arXiv ID are compared; identifiers missing on either
+    paper are ignored.
+    
+    Args:
+        a: First paper
+        b: Second paper
+    
+    Returns:
+        True if any identifier known on both papers differs
+    """
+    for ours, theirs in ((a.doi, b.doi), (a.pmid, b.pmid), (a.arxiv_id, b.arxiv_id)):
+        if ours and theirs and ours.lower().strip() != theirs.lower().strip():
+            return True
+    return False
+
+
+def _priority(paper: Paper) -> Tuple[bool, date]:
+    """
+    Sort key for choosing the primary record among duplicates.
+    
+    Compares PubMed membership first, then publication date; a missing
+    date ranks below any known date.
+    
+    Args:
+        paper: Paper to rank
+    
+    Returns:
+        Tuple that compares higher for the preferred paper
+    """
+    return ("PubMed" in paper.sources, paper.publication_date or date.min)
+
+
+def _year_predicate(year_from: Optional[int], year_to: Optional[int]) -> Callable[[Paper], bool]:
+    """
+    Build a predicate accepting papers published within [year_from, year_to].
+    
+    Papers without a publication date are rejected. Bounds are bound as
+    closure locals so the predicate can be applied in bulk with filter().
+    
+    Args:
+        year_from: Start year (None = no lower bound)
+        year_to: End year (None = no upper bound)
+    
+    Returns:
+        Predicate taking a Paper
+    """
+    low = year_from or 0
+    high = year_to or 9999
+    
+    def year_ok(paper: Paper) -> bool:
+        pub_date = paper.publication_date
+        return isinstance(pub_date, date) and low <= pub_date.year <= high
+    
+    return year_ok
+
+
+def _similar_titles(title_key: str, candidates: List[str]) -> Iterator[str]:
+    """
+    Yield candidates whose similarity to title_key reaches FUZZY_TITLE_THRESHOLD.
+    
+    Uses rapidfuzz if installed, otherwise falls back to difflib. Candidates
+    whose numbers differ from title_key's (e.g. "... 2017" vs "... 2019",
+    "part 1" vs "part 2") are never yielded.
+    
+    Args:
+        title_key: Normalized title to match
+        candidates: Normalized titles to compare against
+    
+    Yields:
+        Matching candidate titles, best match first when rapidfuzz is used
+    """
+    numbers = _TITLE_NUMBER_RE.findall(title_key)
+    if RAPIDFUZZ_AVAILABLE:
+        matches = process.extract(
+            title_key, candidates,
+            scorer=fuzz.ratio,
+            score_cutoff=FUZZY_TITLE_THRESHOLD * 100,
+            limit=None
+        )
+        for candidate, _score, _index in matches:
+            if _TITLE_NUMBER_RE.findall(candidate) == numbers:
+                yield candidate
+        return
+    
+    matcher = SequenceMatcher(None, b=title_key)
+    for candidate in candidates:
+        if _TITLE_NUMBER_RE.findall(candidate) != numbers:
+            continue
+        matcher.set_seq1(candidate)
+        # Cheap upper bounds first, full ratio only if they pass
+        if (matcher.real_quick_ratio() >= FUZZY_TITLE_THRESHOLD
+                and matcher.quick_ratio() >= FUZZY_TITLE_THRESHOLD
+                and matcher.ratio() >= FUZZY_TITLE_THRESHOLD):
+            yield candidate
+
 
 class PaperSearcher:
     """
@@ -32,7 +179,50 @@ class PaperSearcher:
             config: Configuration object (creates default if None)
         """
         self.config = config or Config()
+        
+        # Which sources are configured, probed once (in search order)
+        self._availability: Dict[str, bool] = {
+            'scopus': self.config.has_scopus_access(),
+            'pubmed': self.config.has_pubmed_access(),
+            'arxiv': self.config.has_arxiv_access(),
+            'scholar': self.config.has_scholar_access(),
+            'ieee': self.config.has_ieee_access(),
+        }
+        
+        # One HTTP session shared by all searchers so connections are reused
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # arXiv asks clients to back off on 429/503; configured once here
+        # rather than by every ArxivSearcher sharing the session
+        self._session.mount(
+            "https://export.arxiv.org/",
+            HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=_ARXIV_RETRY)
+        )
+        
         self.papers: Dict[str, Paper] = {}  # Deduplicated papers by title
+        self._pending: List[Paper] = []  # Raw results awaiting deduplication
+        self._reset_indexes()
+    
+    def close(self):
+        """Close the shared HTTP session"""
+        self._session.close()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def _reset_indexes(self):
+        """Clear the deduplication indexes (identifier -> key in self.papers)"""
+        self._by_doi: Dict[str, str] = {}
+        self._by_pmid: Dict[str, str] = {}
+        self._by_title: Dict[str, str] = {}
+        self._blocks: Dict[str, List[str]] = {}  # Block key -> title keys
     
     def search_all(
         self,
@@ -55,66 +245,46 @@ class PaperSearcher:
             Deduplicated list of Paper objects
         """
         self.papers = {}  # Reset
+        self._pending = []
+        self._reset_indexes()
         
         # Determine which sources to use
+        available = self._availability
         if sources is None:
-            sources = []
-            if self.config.has_scopus_access():
-                sources.append('scopus')
-            if self.config.has_pubmed_access():
-                sources.append('pubmed')
-            if self.config.has_arxiv_access():
-                sources.append('arxiv')
-            if self.config.has_scholar_access():
-                sources.append('scholar')
-            if self.config.has_ieee_access():
-                sources.append('ieee')
+            sources = [name for name, ok in available.items() if ok]
         
         logger.info(f"Searching sources: {sources}")
         logger.info(f"Query: {query}")
         
         # Search each source
-        if 'scopus' in sources and self.config.has_scopus_access():
+        if 'scopus' in sources and available['scopus']:
             self._search_scopus(query, year_from, year_to)
         
-        if 'pubmed' in sources and self.config.has_pubmed_access():
+        if 'pubmed' in sources and available['pubmed']:
             self._search_pubmed(query, year_from, year_to)
         
-        if 'arxiv' in sources and self.config.has_arxiv_access():
+        if 'arxiv' in sources and available['arxiv']:
             self._search_arxiv(query, year_from, year_to)
         
-        if 'scholar' in sources and self.config.has_scholar_access():
+        if 'scholar' in sources and available['scholar']:
             self._search_scholar(query, year_from, year_to)
         
-        if 'ieee' in sources and self.config.has_ieee_access():
+        if 'ieee' in sources and available['ieee']:
             self._search_ieee(query, year_from, year_to)
         
+        # Deduplicate everything collected from all sources in one pass
+        self._merge_pending()
+        
         papers_list = list(self.papers.values())
 
         # Enforce year filter robustly across all sources (post-hoc safety net)
         if year_from or year_to:
-            filtered = []
-            filtered_out_count = 0
-            no_date_count = 0
-            
-            for p in papers_list:
-                pd = getattr(p, "publication_date", None)
-                if pd and isinstance(pd, date):
-                    y = pd.year
-                    if year_from and y < year_from:
-                        logger.debug(f"Post-filter: Removed (too old): {y} < {year_from} | {p.title[:80]}")
-                        filtered_out_count += 1
-                        continue
-                    if year_to and y > year_to:
-                        logger.debug(f"Post-filter: Removed (too new): {y} > {year_to} | {p.title[:80]}")
-                        filtered_out_count += 1
-                        continue
-                    filtered.append(p)
-                else:
-                    # No parsed date: drop by default to make year filter strict.
-                    logger.debug(f"Post-filter: Removed (no date): {p.title[:80]}")
-                    no_date_count += 1
-                    continue
+            year_ok = _year_predicate(year_from, year_to)
+            filtered = list(filter(year_ok, papers_list))
+            
+            # No parsed date: dropped by default to make year filter strict
+            no_date_count = sum(1 for p in papers_list if not isinstance(p.publication_date, date))
+            filtered_out_count = len(papers_list) - len(filtered) - no_date_count
 
             logger.info(f"Post-filter year validation: {len(filtered)} papers in range {year_from or 'any'} to {year_to or 'any'}")
             if filtered_out_count > 0:
@@ -136,14 +306,17 @@ class PaperSearcher:
             logger.info("Searching Scopus...")
             logger.info("="*60)
             
+            from .searchers.scopus_searcher import ScopusSearcher
+            
             searcher = ScopusSearcher(
                 api_key=self.config.scopus_api_key,
                 max_results=self.config.max_results_per_source,
-                timeout=self.config.timeout
+                timeout=self.config.timeout,
+                session=self._session
             )
             
             papers = searcher.search(query, year_from, year_to)
-            self._add_papers(papers)
+            self._ingest(papers)
             
             logger.info(f"Scopus: Added {len(papers)} papers")
             
@@ -157,15 +330,18 @@ class PaperSearcher:
             logger.info("Searching PubMed...")
             logger.info("="*60)
             
+            from .searchers.pubmed_searcher import PubMedSearcher
+            
             searcher = PubMedSearcher(
                 email=self.config.pubmed_email,
                 api_key=self.config.pubmed_api_key,
                 max_results=self.config.max_results_per_source,
-                timeout=self.config.timeout
+                timeout=self.config.timeout,
+                session=self._session
             )
             
             papers = searcher.search(query, year_from, year_to)
-            self._add_papers(papers)
+            self._ingest(papers)
             
             logger.info(f"PubMed: Added {len(papers)} papers")
             
@@ -179,13 +355,16 @@ class PaperSearcher:
             logger.info("Searching arXiv...")
             logger.info("="*60)
             
+            from .searchers.arxiv_searcher import ArxivSearcher
+            
             searcher = ArxivSearcher(
                 max_results=self.config.max_results_per_source,
-                timeout=self.config.timeout
+                timeout=self.config.timeout,
+                session=self._session
             )
             
             papers = searcher.search(query, year_from, year_to)
-            self._add_papers(papers)
+            self._ingest(papers)
             
             logger.info(f"arXiv: Added {len(papers)} papers")
             
@@ -208,7 +387,7 @@ class PaperSearcher:
             )
             
             papers = searcher.search(query, year_from, year_to)
-            self._add_papers(papers)
+            self._ingest(papers)
             
             logger.info(f"Google Scholar: Added {len(papers)} papers")
             
@@ -224,24 +403,50 @@ class PaperSearcher:
             logger.info("Searching IEEE Xplore...")
             logger.info("="*60)
             
+            from .searchers.ieee_searcher import IEEESearcher
+            
             searcher = IEEESearcher(
                 api_key=self.config.ieee_api_key,
                 max_results=self.config.max_results_per_source,
-                timeout=self.config.timeout
+                timeout=self.config.timeout,
+                session=self._session
             )
             
             papers = searcher.search(query, year_from, year_to)
-            self._add_papers(papers)
+            self._ingest(papers)
             
             logger.info(f"IEEE: Added {len(papers)} papers")
             
         except Exception as e:
             logger.error(f"IEEE search failed: {e}")
     
+    def _ingest(self, papers: List[Paper]):
+        """
+        Queue raw search results for deduplication.
+        
+        Sources only append here; merging happens once in _merge_pending
+        after all sources have finished.
+        
+        Args:
+            papers: Papers returned by a searcher
+        """
+        self._pending.extend(papers)
+    
+    def _merge_pending(self):
+        """Deduplicate and merge all queued results into self.papers"""
+        pending, self._pending = self._pending, []
+        logger.debug(f"Deduplicating {len(pending)} collected papers")
+        self._add_papers(pending)
+    
     def _add_papers(self, papers: List[Paper]):
         """
         Add papers to collection, deduplicating and merging data.
         
+        A paper is considered a duplicate if any identifier matches an
+        existing entry, checked in order: DOI, PMID, title, then a fuzzy
+        title match within the paper's title block. Title matches are
+        rejected when the papers carry conflicting DOIs, PMIDs or arXiv IDs.
+        
         Deduplication priority:
         1. Prefer PubMed papers (higher download success rate)
         2. If neither or both are PubMed, prefer more recent publication
@@ -250,26 +455,117 @@ class PaperSearcher:
         Args:
             papers: List of papers to add
         """
+        # Local aliases keep attribute lookups out of the loop
+        stored = self.papers
+        find_existing_key = self._find_existing_key
+        index_paper = self._index_paper
+        
         for paper in papers:
-            key = paper.title.lower().strip()
-            
-            if key in self.papers:
-                existing = self.papers[key]
-                new = paper
-                
-                # Determine which paper to keep as primary
-                should_replace = self._should_replace_paper(existing, new)
-                
-                if should_replace:
-                    # Keep new paper as primary, merge existing data into it
-                    new.merge_with(existing)
-                    self.papers[key] = new
-                else:
-                    # Keep existing paper as primary, merge new data into it
-                    existing.merge_with(new)
-            else:
+            key = find_existing_key(paper)
+            
+            if key is None:
                 # Add new paper
-                self.papers[key] = paper
+                key = paper.title_key
+                if key in stored:
+                    # Same title as a different paper (conflicting identifiers)
+                    key = f"{key}#{len(stored)}"
+                stored[key] = paper
+                index_paper(paper, key)
+                continue
+            
+            existing = stored[key]
+            
+            # Determine which paper to keep as primary
+            if self._should_replace_paper(existing, paper):
+                # Keep new paper as primary, merge existing data into it
+                paper.merge_with(existing)
+                stored[key] = survivor = paper
+            else:
+                # Keep existing paper as primary, merge new data into it
+                existing.merge_with(paper)
+                survivor = existing
+            
+            # Point every identifier of the incoming and surviving record at this entry
+            index_paper(paper, key)
+            if survivor is not paper:
+                index_paper(survivor, key)
+    
+    def _find_existing_key(self, paper: Paper) -> Optional[str]:
+        """
+        Find the key of an already stored duplicate of paper.
+        
+        Lookup order: DOI, PMID, exact title, near-identical title.
+        
+        Args:
+            paper: Paper to look up
+        
+        Returns:
+            Key into self.papers, or None if the paper is new
+        """
+        if paper.doi:
+            key = self._by_doi.get(paper.doi.lower().strip())
+            if key is not None:
+                return key
+        if paper.pmid:
+            key = self._by_pmid.get(paper.pmid.strip())
+            if key is not None:
+                return key
+        
+        title_key = paper.title_key
+        key = self._by_title.get(title_key)
+        if key is not None and not _identifiers_conflict(paper, self.papers[key]):
+            return key
+        
+        return self._find_fuzzy_title_key(paper, title_key)
+    
+    def _find_fuzzy_title_key(self, paper: Paper, title_key: str) -> Optional[str]:
+        """
+        Find a stored paper whose title is near-identical to paper's.
+        
+        Only titles in the same block are compared. Papers with conflicting
+        identifiers are never treated as duplicates.
+        
+        Args:
+            paper: Paper to look up
+            title_key: Normalized title of paper
+        
+        Returns:
+            Key into self.papers, or None if no close match exists
+        """
+        candidates = self._blocks.get(_title_block_key(title_key))
+        if not candidates:
+            return None
+        
+        for candidate in _similar_titles(title_key, candidates):
+            key = self._by_title[candidate]
+            existing = self.papers[key]
+            if _identifiers_conflict(paper, existing):
+                continue
+            
+            logger.debug(f"Fuzzy title match: {paper.title[:60]} ~ {existing.title[:60]}")
+            return key
+        
+        return None
+    
+    def _index_paper(self, paper: Paper, key: str):
+        """
+        Register the identifiers of paper in the deduplication indexes.
+        
+        Args:
+            paper: Paper whose identifiers to register
+            key: Key of the entry in self.papers they resolve to
+        """
+        if paper.doi:
+            self._by_doi[paper.doi.lower().strip()] = key
+        if paper.pmid:
+            self._by_pmid[paper.pmid.strip()] = key
+        
+        # The first record with a title keeps it: a later same-title record
+        # split off by conflicting identifiers must not take over the entry
+        title_key = paper.title_key
+        if title_key not in self._by_title:
+            self._blocks.setdefault(_title_block_key(title_key), []).append(title_key)
+            self._by_title[title_key] = key
     
     def _should_replace_paper(self, existing: Paper, new: Paper) -> bool:
         """
@@ -287,33 +583,14 @@ class PaperSearcher:
         Returns:
             True if new paper should replace existing, False otherwise
         """
-        existing_is_pubmed = "PubMed" in existing.sources
-        new_is_pubmed = "PubMed" in new.sources
-        
-        # Priority 1: Prefer PubMed
-        if new_is_pubmed and not existing_is_pubmed:
-            return True
-        if existing_is_pubmed and not new_is_pubmed:
-            return False
-        
-        # Priority 2: Prefer more recent publication
-        if new.publication_date and existing.publication_date:
-            return new.publication_date > existing.publication_date
-        
-        # If only one has a date, prefer the one with a date
-        if new.publication_date and not existing.publication_date:
-            return True
-        if existing.publication_date and not new.publication_date:
-            return False
-        
-        # Default: keep existing
-        return False
+        return _priority(new) > _priority(existing)
     
     def generate_bibliography(
         self,
         papers: Optional[List[Paper]] = None,
         format: str = "bibtex",
-        output_file: Optional[str] = None
+        output_file: Optional[str] = None,
+        return_text: bool = True
     ) -> str:
         """
         Generate bibliography from papers.
@@ -322,20 +599,35 @@ class PaperSearcher:
             papers: List of papers (uses all if None)
             format: Bibliography format ('bibtex' or 'ris')
             output_file: File to write to (optional)
+            return_text: Whether to build and return the bibliography string.
+                         With an output_file and return_text=False, entries are
+                         streamed to disk without holding the full text in memory.
         
         Returns:
-            Bibliography string
+            Bibliography string (empty if streamed with return_text=False)
         """
         if papers is None:
             papers = list(self.papers.values())
         
         if format.lower() == "bibtex":
-            bib_text = self._generate_bibtex(papers)
+            entries = self._iter_bibtex_entries(papers)
         elif format.lower() == "ris":
-            bib_text = self._generate_ris(papers)
+            entries = self._iter_ris_entries(papers)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
+        if output_file and not return_text:
+            # Stream entries straight to the file
+            with open(output_file, 'w', encoding='utf-8') as f:
+                for i, entry in enumerate(entries):
+                    if i:
+                        f.write("\n\n")
+                    f.write(entry)
+            logger.info(f"Bibliography written to: {output_file}")
+            return ""
+        
+        bib_text = "\n\n".join(entries)
+        
         # Write to file if specified
         if output_file:
             Path(output_file).write_text(bib_text, encoding='utf-8')
@@ -345,33 +637,35 @@ class PaperSearcher:
     
     def _generate_bibtex(self, papers: List[Paper]) -> str:
         """Generate BibTeX bibliography"""
-        entries = []
-        
-        # Track cite keys to avoid duplicates
+        return "\n\n".join(self._iter_bibtex_entries(papers))
+    
+    def _iter_bibtex_entries(self, papers: List[Paper]) -> Iterator[str]:
+        """Yield BibTeX entries one at a time"""
+        # Count how often each base cite key was used so far; repeats get
+        # a numeric suffix (Smith_2020, Smith_2020_1, Smith_2020_2, ...).
+        # The count is only where the search starts: a suffixed key may
+        # already be taken by a paper whose base key looks like that
+        key_counts: Counter = Counter()
         used_keys: Set[str] = set()
         
         for paper in papers:
-            # Generate unique cite key
-            if paper.authors and paper.publication_date:
-                base_key = f"{paper.authors[0].split()[-1]}_{paper.publication_date.year}"
-            else:
-                base_key = "Unknown"
-            
-            cite_key = base_key
-            counter = 1
+            base_key = paper.cite_key_base()
+            count = key_counts[base_key]
+            cite_key = f"{base_key}_{count}" if count else base_key
             while cite_key in used_keys:
-                cite_key = f"{base_key}_{counter}"
-                counter += 1
+                count += 1
+                cite_key = f"{base_key}_{count}"
+            key_counts[base_key] = count + 1
             
             used_keys.add(cite_key)
-            entries.append(paper.to_bibtex_entry(cite_key))
-        
-        return "\n\n".join(entries)
+            yield paper.to_bibtex_entry(cite_key)
     
     def _generate_ris(self, papers: List[Paper]) -> str:
         """Generate RIS bibliography"""
-        entries = []
-        
+        return "\n\n".join(self._iter_ris_entries(papers))
+    
+    def _iter_ris_entries(self, papers: List[Paper]) -> Iterator[str]:
+        """Yield RIS entries one at a time"""
         for paper in papers:
             lines = ["TY  - JOUR"]  # Journal article
             
@@ -406,9 +700,7 @@ class PaperSearcher:
                 lines.append(f"UR  - {paper.url}")
             
             lines.append("ER  - ")
-            entries.append("\n".join(lines))
-        
-        return "\n\n".join(entries)
+            yield "\n".join(lines)
     
     def export_to_csv(self, papers: Optional[List[Paper]] = None, output_file: str = "papers.csv"):
         """
@@ -432,9 +724,9 @@ class PaperSearcher:
                 'Citations', 'URL', 'Sources', 'Keywords'
             ])
             
-            # Data
-            for paper in papers:
-                writer.writerow([
+            # Data (single writerows call over a generator of rows)
+            writer.writerows(
+                (
                     paper.title,
                     '; '.join(paper.authors),
                     paper.journal or '',
@@ -445,6 +737,8 @@ class PaperSearcher:
                     paper.url or '',
                     ', '.join(paper.sources),
                     '; '.join(paper.keywords)
-                ])
+                )
+                for paper in papers
+            )
         
         logger.info(f"Papers exported to: {output_file}")
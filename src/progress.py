@@ -5,6 +5,7 @@ Provides consistent progress indicators across all searchers.
 """
 
 import sys
+import time
 from typing import Optional
 
 try:
@@ -19,6 +20,9 @@ class ProgressTracker:
     Unified progress tracker that uses tqdm if available, falls back to simple logging.
     """
     
+    # Minimum seconds between redraws in the fallback (no tqdm) mode
+    MIN_REDRAW_INTERVAL = 0.1
+    
     def __init__(self, total: int, desc: str, disable: bool = False):
         """
         Initialize progress tracker.
@@ -33,6 +37,7 @@ class ProgressTracker:
         self.disable = disable
         self.current = 0
         self.pbar = None
+        self._last_draw = 0.0
         
         if not disable:
             if TQDM_AVAILABLE:
@@ -46,7 +51,7 @@ class ProgressTracker:
                 )
             else:
                 # Fallback to simple print
-                print(f"{desc}: 0/{total} papers", end='\r', flush=True)
+                self._draw()
     
     def update(self, n: int = 1):
         """
@@ -62,9 +67,15 @@ class ProgressTracker:
         
         if self.pbar is not None:
             self.pbar.update(n)
-        else:
-            # Simple progress update
-            print(f"{self.desc}: {self.current}/{self.total} papers", end='\r', flush=True)
+        elif (self.current >= self.total
+              or time.monotonic() - self._last_draw >= self.MIN_REDRAW_INTERVAL):
+            # Simple progress update, throttled to avoid a flush per item
+            self._draw()
+    
+    def _draw(self):
+        """Redraw the fallback progress line."""
+        print(f"{self.desc}: {self.current}/{self.total} papers", end='\r', flush=True)
+        self._last_draw = time.monotonic()
     
     def set_description(self, desc: str):
         """
@@ -82,6 +93,7 @@ class ProgressTracker:
         if self.pbar is not None:
             self.pbar.close()
         elif not self.disable:
+            self._draw()  # Show final count even if last update was throttled
             print()  # New line after progress
     
     def __enter__(self):
@@ -0,0 +1,177 @@
+"""
+Rate limiting utilities for polite API access.
+
+Provides a token bucket limiter that can be shared across requests to one host,
+and a registry of such buckets keyed by host for clients that talk to several.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`. Each
+    request takes one token, so requests leave immediately while tokens are
+    available and only wait for the remainder of the interval otherwise.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum tokens stored (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            
+            # Wait exactly until the next token has accrued, then spend it
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 0.0
+            self.last = time.monotonic()
+    
+    def set_rate(self, rate: float, capacity: Optional[float] = None):
+        """
+        Change the refill rate (and optionally the burst size).
+        
+        Args:
+            rate: New tokens added per second
+            capacity: New maximum tokens stored, or None to keep the current one
+        """
+        with self._lock:
+            self.rate = rate
+            if capacity is not None:
+                self.capacity = capacity
+                self.tokens = min(self.tokens, capacity)
+    
+    def pause(self, seconds: float):
+        """Hold back the next token for at least `seconds` (e.g. after Retry-After)."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+
+class HostRateLimiter:
+    """
+    Per-host token buckets for a client that talks to several services.
+    
+    Known hosts start at their published limits; other hosts get a generous
+    default. Limits advertised by the server (Crossref's X-Rate-Limit-Limit /
+    X-Rate-Limit-Interval) replace the defaults, and Retry-After pauses the
+    host's bucket so the next request waits instead of triggering more 429s.
+    """
+    
+    # Requests per second
+    DEFAULT_RATES = {
+        'api.crossref.org': 50.0,
+        'api.unpaywall.org': 10.0,
+        'arxiv.org': 1 / 3,
+        'export.arxiv.org': 1 / 3,
+    }
+    FALLBACK_RATE = 10.0
+    MAX_PAUSE = 120.0
+    
+    def __init__(self, rates: Optional[Dict[str, float]] = None, max_pause: Optional[float] = None):
+        """
+        Initialize host rate limiter.
+        
+        Args:
+            rates: Overrides for DEFAULT_RATES, keyed by host (netloc)
+            max_pause: Longest Retry-After pause honoured, in seconds
+                (default MAX_PAUSE)
+        """
+        self.rates = dict(self.DEFAULT_RATES)
+        if rates:
+            self.rates.update(rates)
+        self.max_pause = self.MAX_PAUSE if max_pause is None else max_pause
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+    
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    rate = self.rates.get(host, self.FALLBACK_RATE)
+                    bucket = TokenBucket(rate, capacity=max(1.0, rate))
+                    self._buckets[host] = bucket
+        return bucket
+    
+    def acquire(self, url: str):
+        """Wait for a token from the bucket of the URL's host."""
+        self._bucket(url).acquire()
+    
+    def update_from_headers(self, url: str, headers: Mapping[str, str]):
+        """
+        Adjust the host's bucket from rate-limit response headers.
+        
+        Args:
+            url: URL the response came from
+            headers: Response headers (case-insensitive mapping)
+        """
+        limit = headers.get('X-Rate-Limit-Limit')
+        interval = headers.get('X-Rate-Limit-Interval')
+        wait = retry_after(headers)
+        if limit is None and wait is None:
+            return
+        
+        bucket = self._bucket(url)
+        if limit is not None:
+            try:
+                seconds = float((interval or '1s').rstrip('s'))
+                rate = float(limit) / seconds
+            except (ValueError, ZeroDivisionError):
+                rate = None
+            if rate and rate != bucket.rate:
+                bucket.set_rate(rate, capacity=max(1.0, rate))
+        if wait is not None:
+            bucket.pause(min(wait, self.max_pause))
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds.
+    
+    Args:
+        headers: Response headers (case-insensitive mapping)
+        
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
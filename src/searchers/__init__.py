@@ -1,19 +1,30 @@
 """
 Paper searcher implementations for various academic databases
+
+Searcher classes are imported on first access, so importing one searcher
+module does not pull in the dependencies of all the others.
 """
 
-from .scopus_searcher import ScopusSearcher
-from .pubmed_searcher import PubMedSearcher
-from .arxiv_searcher import ArxivSearcher
-from .scholar_searcher import ScholarSearcher
-from .ieee_searcher import IEEESearcher
-from .paper_downloader import PaperDownloader
+import importlib
+
+# Public class name -> submodule defining it
+_SEARCHER_MODULES = {
+    "ScopusSearcher": ".scopus_searcher",
+    "PubMedSearcher": ".pubmed_searcher",
+    "ArxivSearcher": ".arxiv_searcher",
+    "ScholarSearcher": ".scholar_searcher",
+    "IEEESearcher": ".ieee_searcher",
+    "PaperDownloader": ".paper_downloader",
+}
+
+__all__ = list(_SEARCHER_MODULES)
+
 
-__all__ = [
-    "ScopusSearcher",
-    "PubMedSearcher",
-    "ArxivSearcher",
-    "ScholarSearcher",
-    "IEEESearcher",
-    "PaperDownloader",
-]
\ No newline at end of file
+def __getattr__(name):
+    """Import the requested searcher class lazily and cache it on the package"""
+    module_name = _SEARCHER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -4,35 +4,275 @@ Uses the free arXiv API (no key required).
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import List, Optional
-from datetime import datetime
-import xml.etree.ElementTree as ET
-import time
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from datetime import date
+from lxml import etree as ET
 
 from ..models import Paper
 from ..progress import create_progress_tracker
+from ..rate_limit import TokenBucket
 
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for export.arxiv.org: transient failures with backoff
+# (honours Retry-After on 429)
+_ARXIV_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504)
+)
+
+# Query normalization: whitespace runs collapse to one space, wildcards are dropped
+_WS_RE = re.compile(r'\s+')
+_WILDCARD_TABLE = str.maketrans({'*': None})
+
+
+def _parse_iso_date(text: str) -> Optional[date]:
+    """
+    Parse the date part of an ISO 8601 timestamp (YYYY-MM-DDTHH:MM:SSZ).
+    
+    Slices the fixed-width fields directly instead of going through strptime.
+    
+    Args:
+        text: Timestamp string
+    
+    Returns:
+        date or None if the text is not a valid date
+    """
+    text = text.strip()
+    if len(text) < 10 or text[4] != '-' or text[7] != '-':
+        return None
+    try:
+        return date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+    except ValueError:
+        return None
+
+
+# Namespace-qualified (Clark notation) tags of the arXiv Atom feed
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_ARXIV = '{http://arxiv.org/schemas/atom}'
+_OPENSEARCH = '{http://a9.com/-/spec/opensearch/1.1/}'
+_ENTRY = _ATOM + 'entry'
+_TITLE = _ATOM + 'title'
+_NAME = _ATOM + 'name'
+_SUMMARY = _ATOM + 'summary'
+_ID = _ATOM + 'id'
+_PUBLISHED = _ATOM + 'published'
+_CATEGORY = _ATOM + 'category'
+_DOI = _ARXIV + 'doi'
+_JOURNAL_REF = _ARXIV + 'journal_ref'
+_TOTAL_RESULTS = _OPENSEARCH + 'totalResults'
+
+# Elements whose text content is collected
+_TEXT_TAGS = frozenset((_TITLE, _NAME, _SUMMARY, _ID, _PUBLISHED, _DOI, _JOURNAL_REF, _TOTAL_RESULTS))
+
+
+class _FeedResult(NamedTuple):
+    """Outcome of parsing one arXiv feed page"""
+    total_results: int
+    entry_count: int
+    papers: List[Paper]
+    reached_year_from: bool
+
+
+class _ArxivFeedTarget:
+    """
+    Parser target that turns an arXiv Atom feed into Paper objects.
+    
+    Receives start/data/end events straight from the parser, so no element
+    tree is built. Entries published outside [year_from, year_to] are dropped
+    before their other fields are processed. close() returns a _FeedResult
+    and resets the target for the next feed.
+    """
+    
+    def __init__(self):
+        self.year_from: Optional[int] = None
+        self.year_to: Optional[int] = None
+        self._reset()
+    
+    def _reset(self):
+        self.total_results = 0
+        self.entry_count = 0
+        self.papers: List[Paper] = []
+        self.reached_year_from = False
+        self._in_entry = False
+        self._text: Optional[List[str]] = None
+        self._fields: Dict[str, str] = {}
+        self._authors: List[str] = []
+        self._categories: List[str] = []
+    
+    def start(self, tag, attrib):
+        if tag == _ENTRY:
+            self._in_entry = True
+            self._fields = {}
+            self._authors = []
+            self._categories = []
+        elif tag in _TEXT_TAGS:
+            self._text = []
+        elif tag == _CATEGORY and self._in_entry:
+            # The same few category codes repeat on every entry; intern them
+            # so all papers share one string object per code
+            term = attrib.get('term')
+            if term:
+                self._categories.append(sys.intern(term))
+    
+    def data(self, data):
+        if self._text is not None:
+            self._text.append(data)
+    
+    def end(self, tag):
+        if tag == _ENTRY:
+            self._in_entry = False
+            self.entry_count += 1
+            paper = self._make_paper()
+            if paper:
+                self.papers.append(paper)
+            return
+        
+        if self._text is None or tag not in _TEXT_TAGS:
+            return
+        text = ''.join(self._text)
+        self._text = None
+        
+        if tag == _TOTAL_RESULTS:
+            self.total_results = int(text) if text.strip() else 0
+        elif not self._in_entry:
+            return
+        elif tag == _NAME:
+            if text:
+                # Co-authors recur across papers of a search; share their names
+                self._authors.append(sys.intern(text.strip()))
+        elif text:
+            self._fields[tag] = text
+    
+    def close(self) -> _FeedResult:
+        result = _FeedResult(self.total_results, self.entry_count, self.papers, self.reached_year_from)
+        self._reset()
+        return result
+    
+    def _make_paper(self) -> Optional[Paper]:
+        """
+        Build a Paper from the fields collected for the current entry.
+        
+        Returns:
+            Paper object or None if parsing fails
+        """
+        fields = self._fields
+        try:
+            # Publication/submission date first: out-of-range entries are
+            # skipped before any other field is touched
+            published = fields.get(_PUBLISHED)
+            publication_date = _parse_iso_date(published) if published else None
+            if publication_date:
+                year = publication_date.year
+                if self.year_from and year < self.year_from:
+                    self.reached_year_from = True
+                    return None
+                if self.year_to and year > self.year_to:
+                    return None
+            
+            # Title
+            title = fields.get(_TITLE)
+            if not title:
+                return None
+            
+            # arXiv ID
+            arxiv_id = url = pdf_url = None
+            entry_id = fields.get(_ID)
+            if entry_id:
+                arxiv_id = entry_id.split('/abs/')[-1]
+                url = f"https://arxiv.org/abs/{arxiv_id}"
+                pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+            
+            # Abstract, DOI and journal reference (the latter two only if published)
+            summary = fields.get(_SUMMARY)
+            doi = fields.get(_DOI)
+            journal = fields.get(_JOURNAL_REF)
+            
+            # Build the Paper in one go rather than setting fields one by one
+            paper = Paper(
+                title=title.strip().replace('\n', ' '),
+                authors=self._authors,
+                abstract=summary.strip().replace('\n', ' ') if summary else None,
+                doi=doi.strip() if doi else None,
+                arxiv_id=arxiv_id,
+                publication_date=publication_date,
+                journal=journal.strip() if journal else None,
+                url=url,
+                pdf_url=pdf_url,
+                sources={"arXiv"}
+            )
+            
+            # Categories as keywords, added with a single call
+            paper.add_keywords(self._categories)
+            
+            return paper
+            
+        except Exception as e:
+            logger.debug(f"Failed to parse arXiv entry: {e}")
+            return None
+
+
+# One reusable feed parser per thread (lxml parsers are not thread-safe)
+_parser_local = threading.local()
+
+
+def _feed_parser() -> Tuple[ET.XMLParser, _ArxivFeedTarget]:
+    """Return this thread's arXiv feed parser and its target, creating them on first use"""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        _parser_local.target = _ArxivFeedTarget()
+        # Feeds are untrusted input: never expand entities or fetch external DTDs
+        parser = _parser_local.parser = ET.XMLParser(
+            target=_parser_local.target, resolve_entities=False, no_network=True
+        )
+    return parser, _parser_local.target
+
 
 class ArxivSearcher:
     """Search for papers in arXiv"""
     
-    BASE_URL = "http://export.arxiv.org/api/query"
+    BASE_URL = "https://export.arxiv.org/api/query"
+    CHUNK_SIZE = 16384  # Bytes fed to the XML parser at a time
+    
+    # arXiv API terms: no more than one request every three seconds.
+    # Shared by all instances so consecutive searches are throttled too.
+    _bucket = TokenBucket(rate=1 / 3)
     
-    def __init__(self, max_results: int = 1000, timeout: int = 30):
+    # Sent with every request (the session may be shared with other searchers)
+    HEADERS = {
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'User-Agent': 'review_buddy/1.0',
+    }
+    
+    def __init__(self, max_results: int = 1000, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         Initialize arXiv searcher.
         
         Args:
             max_results: Maximum number of results to fetch
             timeout: Request timeout in seconds
+            session: Shared HTTP session, used as configured by its owner
+                (creates a new one with an arXiv retry policy if None)
         """
         self.max_results = max_results
         self.timeout = timeout
-        self.session = requests.Session()
+        if session is None:
+            session = requests.Session()
+            session.mount(
+                "https://export.arxiv.org/",
+                HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=_ARXIV_RETRY)
+            )
+        self.session = session
     
     def search(self, query: str, year_from: Optional[int] = None, year_to: Optional[int] = None) -> List[Paper]:
         """
@@ -50,20 +290,20 @@ class ArxivSearcher:
         
         # Normalize query - remove newlines and extra whitespace
         # This is crucial for queries read from .txt files
-        normalized_query = ' '.join(query.split())
-        
         # arXiv doesn't support wildcards (*), so remove them
         # Replace common patterns like "Electroencephalogra*" with just "Electroencephalogr"
-        arxiv_safe_query = normalized_query.replace('*', '')
-        
         # arXiv also has issues with "NOT" - it uses "ANDNOT" instead
-        # Convert " NOT " to " ANDNOT "
-        arxiv_safe_query = arxiv_safe_query.replace(' NOT ', ' ANDNOT ')
+        arxiv_safe_query = (
+            _WS_RE.sub(' ', query.strip())
+            .translate(_WILDCARD_TABLE)
+            .replace(' NOT ', ' ANDNOT ')
+        )
         
         # arXiv API query format: search in all fields
         arxiv_query = f"all:{arxiv_safe_query}"
         
-        # Add date filtering to the query if year range is specified
+        # Add date filtering to the query if year range is specified, so the
+        # server does the year filtering and out-of-range entries are never sent
         # arXiv uses submittedDate with format [YYYYMMDDTTTT TO YYYYMMDDTTTT]
         if year_from or year_to:
             from_date = f"{year_from or 1900}01010000"
@@ -73,111 +313,66 @@ class ArxivSearcher:
         
         logger.info(f"Searching arXiv with query: {arxiv_query[:200]}...")  # Truncate for readability
         
-        # Determine sort order based on year filter
-        # If filtering by year_from, sort ascending (oldest first) to hit the range faster
-        # Otherwise sort descending (newest first) for most recent results
-        if year_from:
-            sort_order = 'ascending'
-            logger.debug(f"arXiv: Using ascending sort to reach year_from={year_from}")
-        else:
-            sort_order = 'descending'
+        # Sort descending (newest first); once an entry older than year_from
+        # shows up, every later entry is older too and we can stop
+        sort_order = 'descending'
         
-        # Fetch in batches
+        # Query parameters that stay the same for every batch
+        params = {
+            'search_query': arxiv_query,
+            'sortBy': 'submittedDate',
+            'sortOrder': sort_order
+        }
+        
+        # Fetch in batches. While one page is being consumed the next one is
+        # already requested and parsed in a worker thread; the token bucket in
+        # _fetch_page keeps the request cadence within arXiv's limits
         start = 0
         batch_size = 100  # arXiv recommends max 100 per request
+        limit = self.max_results  # Narrowed to totalResults after the first page
         progress = None
         
-        while len(papers) < self.max_results:
-            try:
-                # Make request
-                params = {
-                    'search_query': arxiv_query,
-                    'start': start,
-                    'max_results': min(batch_size, self.max_results - len(papers)),
-                    'sortBy': 'submittedDate',
-                    'sortOrder': sort_order
-                }
-                
-                response = self.session.get(
-                    self.BASE_URL,
-                    params=params,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                # Parse XML response
-                root = ET.fromstring(response.content)
-                
-                # Define namespace
-                ns = {'atom': 'http://www.w3.org/2005/Atom',
-                      'arxiv': 'http://arxiv.org/schemas/atom'}
-                
-                entries = root.findall('atom:entry', ns)
-                
-                if not entries:
+        executor = ThreadPoolExecutor(max_workers=1)
+        page_size = min(batch_size, limit)
+        next_page = executor.submit(self._fetch_page, dict(params, start=start, max_results=page_size), year_from, year_to)
+        
+        try:
+            while next_page is not None:
+                try:
+                    result = next_page.result()
+                except Exception as e:
+                    logger.error(f"arXiv request failed: {e}")
+                    import traceback
+                    logger.debug(f"arXiv error traceback: {traceback.format_exc()}")
                     break
+                next_page = None
                 
                 # Initialize progress bar on first batch
-                if progress is None and entries:
-                    # Get total results from opensearch:totalResults
-                    total_results_elem = root.find('opensearch:totalResults', 
-                                                  {'opensearch': 'http://a9.com/-/spec/opensearch/1.1/'})
-                    if total_results_elem is not None and total_results_elem.text:
-                        total_results = int(total_results_elem.text)
-                        max_to_fetch = min(total_results, self.max_results)
-                        progress = create_progress_tracker(max_to_fetch, "arXiv")
-                
-                filtered_out_count = 0
-                fetched_count = 0
-                papers_too_new = 0  # Track if we've exceeded year_to
-                
-                for entry in entries:
-                    paper = self._parse_entry(entry, ns)
-                    if paper:
-                        fetched_count += 1
-                        # Apply year filter
-                        if year_from or year_to:
-                            if paper.publication_date:
-                                year = paper.publication_date.year
-                                if year_from and year < year_from:
-                                    logger.debug(f"arXiv: Filtered out (too old): {year} < {year_from} | {paper.title[:80]}")
-                                    filtered_out_count += 1
-                                    continue
-                                if year_to and year > year_to:
-                                    logger.debug(f"arXiv: Filtered out (too new): {year} > {year_to} | {paper.title[:80]}")
-                                    filtered_out_count += 1
-                                    papers_too_new += 1
-                                    continue
-                            else:
-                                logger.debug(f"arXiv: Filtered out (no date): {paper.title[:80]}")
-                                filtered_out_count += 1
-                                continue
-                        
-                        papers.append(paper)
-                        if progress:
-                            progress.update(1)
+                if progress is None and result.total_results > 0:
+                    limit = min(result.total_results, self.max_results)
+                    progress = create_progress_tracker(limit, "arXiv")
                 
-                if filtered_out_count > 0:
-                    logger.info(f"arXiv batch: fetched {fetched_count}, accepted {fetched_count - filtered_out_count}, filtered out {filtered_out_count}")
-                
-                # If we're getting too many papers beyond year_to and sorting ascending, we can stop
-                # This happens when sorting ascending and we've moved past the desired range
-                if year_to and sort_order == 'descending' and papers_too_new > batch_size * 0.8:
-                    logger.info(f"arXiv: Stopping early - most papers now exceed year_to={year_to}")
-                    break
-                
-                # Check if we should continue
-                if len(entries) < batch_size or len(papers) >= self.max_results:
-                    break
+                if result.reached_year_from:
+                    logger.info(f"arXiv: Stopping early - reached papers older than year_from={year_from}")
                 
+                # Request the following page before consuming this one, unless
+                # this page was short (end of results) or hit the year limit
                 start += batch_size
-                time.sleep(0.5)  # Be nice to arXiv API
+                if result.entry_count >= page_size and not result.reached_year_from and start < limit:
+                    page_size = min(batch_size, limit - start)
+                    next_page = executor.submit(
+                        self._fetch_page, dict(params, start=start, max_results=page_size), year_from, year_to
+                    )
                 
-            except Exception as e:
-                logger.error(f"arXiv request failed: {e}")
-                import traceback
-                logger.debug(f"arXiv error traceback: {traceback.format_exc()}")
-                break
+                # Entries outside the year range (a safety net in case the
+                # server ignored the date filter) were already dropped
+                papers.extend(result.papers)
+                if progress:
+                    progress.update(len(result.papers))
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown(wait=False)
         
         if progress:
             progress.close()
@@ -187,73 +382,38 @@ class ArxivSearcher:
             logger.info(f"arXiv: Year filter applied - range: {year_from or 'any'} to {year_to or 'any'}")
         return papers
     
-    def _parse_entry(self, entry: ET.Element, ns: dict) -> Optional[Paper]:
+    def _fetch_page(self, params: dict, year_from: Optional[int], year_to: Optional[int]) -> _FeedResult:
         """
-        Parse an arXiv entry into a Paper object.
+        Request and parse one page of arXiv results.
         
         Args:
-            entry: XML element for entry
-            ns: XML namespace dict
+            params: Query parameters for this page
+            year_from: Start year filter (applied to submission date)
+            year_to: End year filter (applied to submission date)
         
         Returns:
-            Paper object or None if parsing fails
+            Parsed page
         """
-        try:
-            # Title
-            title_elem = entry.find('atom:title', ns)
-            if title_elem is None or not title_elem.text:
-                return None
-            
-            title = title_elem.text.strip().replace('\n', ' ')
-            paper = Paper(title=title)
-            paper.sources.add("arXiv")
-            
-            # Authors
-            for author_elem in entry.findall('atom:author', ns):
-                name_elem = author_elem.find('atom:name', ns)
-                if name_elem is not None and name_elem.text:
-                    paper.authors.append(name_elem.text.strip())
-            
-            # Abstract
-            summary_elem = entry.find('atom:summary', ns)
-            if summary_elem is not None and summary_elem.text:
-                paper.abstract = summary_elem.text.strip().replace('\n', ' ')
-            
-            # arXiv ID
-            id_elem = entry.find('atom:id', ns)
-            if id_elem is not None and id_elem.text:
-                arxiv_id = id_elem.text.split('/abs/')[-1]
-                paper.arxiv_id = arxiv_id
-                paper.url = f"https://arxiv.org/abs/{arxiv_id}"
-                paper.pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-            
-            # DOI (if published)
-            doi_elem = entry.find('arxiv:doi', ns)
-            if doi_elem is not None and doi_elem.text:
-                paper.doi = doi_elem.text.strip()
-            
-            # Publication/submission date
-            published_elem = entry.find('atom:published', ns)
-            if published_elem is not None and published_elem.text:
-                try:
-                    date_str = published_elem.text.split('T')[0]
-                    paper.publication_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                except:
-                    pass
-            
-            # Journal reference (if published)
-            journal_elem = entry.find('arxiv:journal_ref', ns)
-            if journal_elem is not None and journal_elem.text:
-                paper.journal = journal_elem.text.strip()
-            
-            # Categories as keywords
-            for category_elem in entry.findall('atom:category', ns):
-                term = category_elem.get('term')
-                if term:
-                    paper.keywords.add(term)
-            
-            return paper
+        self._bucket.acquire()  # Be nice to arXiv API
+        
+        with self.session.get(
+            self.BASE_URL,
+            params=params,
+            headers=self.HEADERS,
+            timeout=self.timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
             
-        except Exception as e:
-            logger.debug(f"Failed to parse arXiv entry: {e}")
-            return None
+            # Parse the XML response with the reusable event-driven parser:
+            # entries become Paper objects directly, without an element tree.
+            # Chunks are fed as they arrive, so parsing overlaps the download
+            parser, target = _feed_parser()
+            target.year_from, target.year_to = year_from, year_to
+            try:
+                for chunk in response.iter_content(self.CHUNK_SIZE):
+                    parser.feed(chunk)
+                return parser.close()
+            except Exception:
+                _parser_local.parser = None  # Don't reuse a parser left mid-document
+                raise
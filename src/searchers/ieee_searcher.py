@@ -5,8 +5,11 @@ Requires IEEE API key from: https://developer.ieee.org/
 
 import requests
 import logging
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
-from datetime import datetime
+from datetime import date
 
 from ..models import Paper
 from ..progress import create_progress_tracker
@@ -15,12 +18,20 @@ from ..progress import create_progress_tracker
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _year_start(year: int) -> date:
+    """January 1st of the given year (IEEE only reports publication years)"""
+    return date(year, 1, 1)
+
+
 class IEEESearcher:
     """Search for papers in IEEE Xplore"""
     
     BASE_URL = "https://ieeexploreapi.ieee.org/api/v1/search/articles"
+    MAX_WORKERS = 4  # Concurrent requests for the batches after the first
     
-    def __init__(self, api_key: str, max_results: int = 1000, timeout: int = 30):
+    def __init__(self, api_key: str, max_results: int = 1000, timeout: int = 30,
+                 session: Optional[requests.Session] = None):
         """
         Initialize IEEE searcher.
         
@@ -28,6 +39,7 @@ class IEEESearcher:
             api_key: IEEE API key
             max_results: Maximum number of results to fetch
             timeout: Request timeout in seconds
+            session: Shared HTTP session (creates a new one if None)
         """
         if not api_key:
             raise ValueError("IEEE API key is required")
@@ -35,7 +47,7 @@ class IEEESearcher:
         self.api_key = api_key
         self.max_results = max_results
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = session or requests.Session()
     
     def search(self, query: str, year_from: Optional[int] = None, year_to: Optional[int] = None) -> List[Paper]:
         """
@@ -50,6 +62,8 @@ class IEEESearcher:
             List of Paper objects
         """
         papers = []
+        if self.max_results <= 0:
+            return papers
         
         # Normalize query - remove newlines and extra whitespace
         # This is crucial for queries read from .txt files
@@ -57,71 +71,74 @@ class IEEESearcher:
         
         logger.info(f"Searching IEEE Xplore with query: {normalized_query}")
         
-        # Fetch in batches
-        start = 1  # IEEE starts at 1, not 0
+        # Parameters shared by every batch
+        params = {
+            'apikey': self.api_key,
+            'querytext': normalized_query,
+            'sort_order': 'desc',
+            'sort_field': 'publication_year'
+        }
+        
+        # Add year filters
+        if year_from:
+            params['start_year'] = year_from
+        if year_to:
+            params['end_year'] = year_to
+        
         batch_size = 200  # IEEE max per request
-        progress = None
         
-        while len(papers) < self.max_results:
+        # The first batch also reports how many records there are
+        try:
+            first_count = min(batch_size, self.max_results)
+            data = self._fetch_batch(params, 1, first_count)  # IEEE starts at 1, not 0
+        except Exception as e:
+            logger.error(f"IEEE request failed: {e}")
+            return papers
+        
+        if 'ERROR' in data:
+            logger.error(f"IEEE API error: {data['ERROR']}")
+            return papers
+        
+        total_records = int(data.get('total_records', 0))
+        logger.info(f"IEEE: Found {total_records} total results")
+        max_to_fetch = min(total_records, self.max_results)
+        progress = create_progress_tracker(max_to_fetch, "IEEE")
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            # Request all remaining batches at once instead of one after another;
+            # they are still consumed in order so results keep the API's sorting
+            futures = []
+            if len(data.get('articles', [])) >= first_count:
+                futures = [
+                    executor.submit(self._fetch_batch, params, start, min(batch_size, max_to_fetch - start + 1))
+                    for start in range(1 + batch_size, max_to_fetch + 1, batch_size)
+                ]
+            
             try:
-                # Build parameters
-                params = {
-                    'apikey': self.api_key,
-                    'querytext': normalized_query,
-                    'max_records': min(batch_size, self.max_results - len(papers)),
-                    'start_record': start,
-                    'sort_order': 'desc',
-                    'sort_field': 'publication_year'
-                }
-                
-                # Add year filters
-                if year_from:
-                    params['start_year'] = year_from
-                if year_to:
-                    params['end_year'] = year_to
-                
-                response = self.session.get(
-                    self.BASE_URL,
-                    params=params,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Check for errors
-                if 'ERROR' in data:
-                    logger.error(f"IEEE API error: {data['ERROR']}")
-                    break
-                
-                total_records = int(data.get('total_records', 0))
-                
-                if start == 1:
-                    logger.info(f"IEEE: Found {total_records} total results")
-                    max_to_fetch = min(total_records, self.max_results)
-                    progress = create_progress_tracker(max_to_fetch, "IEEE")
-                
-                articles = data.get('articles', [])
-                
-                if not articles:
-                    break
-                
-                for article in articles:
-                    paper = self._parse_article(article)
-                    if paper:
-                        papers.append(paper)
-                        if progress:
-                            progress.update(1)
-                
-                # Check if we should continue
-                if len(articles) < batch_size or len(papers) >= self.max_results or len(papers) >= total_records:
-                    break
-                
-                start += batch_size
+                for future in [None] + futures:
+                    if future is not None:
+                        data = future.result()
+                        if 'ERROR' in data:
+                            logger.error(f"IEEE API error: {data['ERROR']}")
+                            break
+                    
+                    articles = data.get('articles', [])
+                    if not articles:
+                        break
+                    
+                    for article in articles:
+                        paper = self._parse_article(article)
+                        if paper:
+                            papers.append(paper)
+                            if progress:
+                                progress.update(1)
                 
             except Exception as e:
                 logger.error(f"IEEE request failed: {e}")
-                break
+            finally:
+                # Don't start batches that are no longer needed
+                for future in futures:
+                    future.cancel()
         
         if progress:
             progress.close()
@@ -129,6 +146,26 @@ class IEEESearcher:
         logger.info(f"IEEE: Successfully retrieved {len(papers)} papers")
         return papers
     
+    def _fetch_batch(self, params: dict, start: int, count: int) -> dict:
+        """
+        Request one batch of results.
+        
+        Args:
+            params: Query parameters shared by all batches
+            start: 1-based index of the first record
+            count: Number of records to request
+        
+        Returns:
+            Decoded JSON response
+        """
+        response = self.session.get(
+            self.BASE_URL,
+            params={**params, 'start_record': start, 'max_records': count},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+    
     def _parse_article(self, article: dict) -> Optional[Paper]:
         """
         Parse an IEEE article into a Paper object.
@@ -178,8 +215,8 @@ class IEEESearcher:
             pub_year = article.get('publication_year')
             if pub_year:
                 try:
-                    paper.publication_date = datetime(int(pub_year), 1, 1).date()
-                except:
+                    paper.publication_date = _year_start(int(pub_year))
+                except (TypeError, ValueError):
                     pass
             
             # Publisher
@@ -199,18 +236,11 @@ class IEEESearcher:
             if pdf_url:
                 paper.pdf_url = pdf_url
             
-            # Keywords/index terms
+            # Keywords/index terms: author keywords and IEEE terms, added in one call
             index_terms = article.get('index_terms', {})
-            
-            # Author keywords
             author_terms = index_terms.get('author_terms', {}).get('terms', [])
-            for term in author_terms:
-                paper.keywords.add(term)
-            
-            # IEEE terms
             ieee_terms = index_terms.get('ieee_terms', {}).get('terms', [])
-            for term in ieee_terms:
-                paper.keywords.add(term)
+            paper.add_keywords(chain(author_terms, ieee_terms))
             
             return paper
             
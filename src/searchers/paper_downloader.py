@@ -5,39 +5,314 @@ Downloads PDFs for papers listed in a .bib or .ris file, prioritizing open acces
 Supports fallback strategies and optional Sci-Hub integration.
 """
 import os
+import re
+import contextvars
+import json
+import time
 import logging
-from typing import List, Optional
+import queue
+import threading
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from datetime import date
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Set
 from pathlib import Path
+from urllib.parse import quote, urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..models import Paper
+from ..rate_limit import HostRateLimiter
 
 # External dependencies: requests, unpaywall, bibtexparser, rispy
 # Sci-Hub support: requires user opt-in and third-party library (e.g., sci-hub-py)
 
+# Any character that str.isalnum() rejects (\W also spares "_", which maps to itself)
+_UNSAFE_FILENAME_CHAR_RE = re.compile(r'\W')
+
+# Every PDF file starts with this signature
+_PDF_MAGIC = b'%PDF'
+
+# Browser-like request headers; some publishers refuse the default requests UA
+_BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+_PDF_REQUEST_HEADERS = {
+    'User-Agent': _BROWSER_USER_AGENT,
+    'Accept': 'application/pdf,application/octet-stream,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Referer': 'https://www.google.com/',
+}
+_HTML_REQUEST_HEADERS = {
+    'User-Agent': _BROWSER_USER_AGENT,
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+}
+
+# Connection pool sizes for the shared HTTP session
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
+# Transient HTTP errors retried by the shared session (with exponential
+# backoff, or as long as Retry-After asks, up to _RETRY_AFTER_MAX per retry)
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 1
+_RETRY_STATUSES = (429, 502, 503, 504)
+
+# Longest Retry-After wait honoured per retry, and by the rate limiter
+# afterwards; keeps one 429/503 from stalling a paper for more than ~15s
+_RETRY_AFTER_MAX = 3.0
+
+# Identifiers pulled out of landing-page URLs
+_ARXIV_URL_RE = re.compile(r'arxiv\.org/(?:abs|pdf)/(\d+\.\d+)')
+_PUBMED_URL_RE = re.compile(r'pubmed\.ncbi\.nlm\.nih\.gov/(\d+)')
+_BIORXIV_DOI_RE = re.compile(r'/(10\.1101/[\d.]+)(v\d+)?')
+_IEEE_DOCUMENT_RE = re.compile(r'/document/(\d+)')
+_ACM_DOI_RE = re.compile(r'/doi/(?:abs/)?(\d+\.\d+/\d+)')
+
+# PDF links in a ResearchGate search page, tried in order
+_RESEARCHGATE_PDF_PATTERNS = (
+    re.compile(r'href=["\']([^"\']*(?:download|pdf)[^"\']*\.pdf[^"\']*)["\']'),
+    re.compile(r'"fullText"["\']?\s*:\s*"([^"]+\.pdf[^"]*)"'),
+    re.compile(r'data-ua-action-data="([^"]*\.pdf[^"]*)"'),
+)
+
+# Concurrent Crossref title searches in the DOI pre-pass (the host rate
+# limiter still caps the request rate)
+_DOI_LOOKUP_WORKERS = 8
+
+# Per-paper metadata lookups (Unpaywall, Crossref, PMC) run at the same time
+_SOURCE_LOOKUPS_PER_PAPER = 3
+
+# Lookups cached in output_dir: results for 30 days, "not found" for 7
+_API_CACHE_FILE = '.api_cache.json'
+_API_CACHE_TTL = 30 * 86400
+_API_CACHE_NEGATIVE_TTL = 7 * 86400
+
+# Papers that failed with every enabled source are not retried for 7 days
+_FAILED_RETRY_TTL = 7 * 86400
+
+# URLs of the current paper's requests that failed in a way worth retrying
+# later (network errors, 429 and 5xx responses). A paper is only remembered as
+# failed when this stays empty, i.e. every source gave a definitive answer.
+_transient_errors: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar('_transient_errors', default=None)
+
+# PDFs are streamed to disk in chunks through a buffered file, after
+# checking the signature in the first _SNIFF_SIZE bytes
+_SNIFF_SIZE = 4096
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# DOI prefix -> PDF URL for publishers whose PDF location follows from the DOI
+# alone ({doi} is the full DOI, {suffix} the part after the first "/")
+_DOI_PDF_PATTERNS = (
+    ('10.1177/', 'https://journals.sagepub.com/doi/pdf/{doi}'),           # SAGE
+    ('10.1145/', 'https://dl.acm.org/doi/pdf/{doi}'),                     # ACM
+    ('10.3389/', 'https://www.frontiersin.org/articles/{doi}/pdf'),       # Frontiers
+    ('10.1038/', 'https://www.nature.com/articles/{suffix}.pdf'),         # Nature
+    ('10.1371/journal.pone.', 'https://journals.plos.org/plosone/article/file?id={doi}&type=printable'),  # PLOS ONE
+)
+
+# Tag searches tried in order by _try_scrape_pdf_link. Built once at import
+# rather than on every call; 'kwargs' holds the find_all() keyword arguments.
+_SCRAPE_TAG_PATTERNS = [
+    # Direct PDF links
+    {'name': 'a', 'href': lambda x: x and x.endswith('.pdf')},
+    {'name': 'a', 'href': lambda x: x and '.pdf' in x.lower()},
+    # Download buttons with "PDF", "download", "full text"
+    {'name': 'a', 'string': lambda x: x and any(w in str(x).lower() for w in ['pdf', 'download', 'full text', 'full-text'])},
+    {'name': 'button', 'string': lambda x: x and any(w in str(x).lower() for w in ['pdf', 'download', 'full text'])},
+    {'name': 'a', 'class_': lambda x: x and any(c in str(x).lower() for c in ['pdf', 'download', 'fulltext'])},
+    # Meta tags for PDF
+    {'name': 'meta', 'attrs': {'name': 'citation_pdf_url'}},
+    {'name': 'meta', 'attrs': {'property': 'og:pdf'}},
+    # Publisher specific
+    {'name': 'a', 'attrs': {'title': lambda x: x and 'PDF' in str(x)}},
+    {'name': 'a', 'attrs': {'data-track-action': 'download pdf'}},
+    {'name': 'a', 'attrs': {'href': lambda x: x and 'pdf' in x.lower() and 'download' in x.lower()}},
+]
+for _pattern in _SCRAPE_TAG_PATTERNS:
+    _pattern['kwargs'] = {k: v for k, v in _pattern.items() if k != 'name'}
+del _pattern
+
+# PDF URLs embedded in page scripts
+_SCRAPE_JS_PDF_PATTERNS = (
+    re.compile(r'https?://[^"\'\s<>]+\.pdf'),
+    re.compile(r'"url":\s*"([^"]+\.pdf[^"]*)"'),
+    re.compile(r'pdfUrl["\']?\s*[:=]\s*["\']([^"\']+\.pdf[^"\']*)["\']'),
+)
+
 class DownloadError(Exception):
     pass
 
+
+def _crossref_pdf_link(work: dict) -> Optional[str]:
+    """URL of the first application/pdf entry in a Crossref work's 'link' list"""
+    for link in work.get('link') or ():
+        if link.get('content-type') == 'application/pdf' and link.get('URL'):
+            return link['URL']
+    return None
+
+
+def _shutdown_logging(logger: logging.Logger, queue_handler: QueueHandler,
+                      listener: QueueListener, handlers: tuple):
+    """Detach a downloader's queue handler, write out its queued records and close its handlers"""
+    logger.removeHandler(queue_handler)
+    listener.stop()
+    for handler in handlers:
+        handler.close()
+
+
+# Log shutdown of the newest PaperDownloader; the next one runs it before
+# taking over the shared "PaperDownloader" logger
+_active_log_shutdown: Optional[weakref.finalize] = None
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry that never sleeps longer than _RETRY_AFTER_MAX for Retry-After"""
+    
+    def get_retry_after(self, response):
+        seconds = super().get_retry_after(response)
+        if seconds is None:
+            return None
+        return min(seconds, _RETRY_AFTER_MAX)
+
+
+# Returned by _ApiCache.get for keys that are not cached (None is a cached miss)
+_MISSING = object()
+
+
+class _ApiCache:
+    """
+    JSON file cache for API lookups (title -> DOI, DOI -> PDF URL).
+    
+    The mappings hardly change between runs, so re-running on an updated
+    bibliography only queries the new entries. Found values and "not found"
+    results (None) expire after different TTLs.
+    """
+    
+    def __init__(self, path: Path, ttl: float = _API_CACHE_TTL, negative_ttl: float = _API_CACHE_NEGATIVE_TTL):
+        """
+        Load the cache file, dropping expired entries.
+        
+        Args:
+            path: JSON file backing the cache
+            ttl: Seconds a found value stays valid
+            negative_ttl: Seconds a "not found" result stays valid
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._dirty = False
+        
+        # key -> [expires_at, value]
+        self._entries: Dict[str, list] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            now = time.time()
+            self._entries = {k: v for k, v in entries.items() if v[0] > now}
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError, IndexError, AttributeError) as e:
+            logging.getLogger(__name__).warning(f"Ignoring unreadable API cache {path}: {e}")
+    
+    def get(self, namespace: str, key: str) -> Any:
+        """Return the cached value (possibly None), or _MISSING"""
+        entry = self._entries.get(f"{namespace}:{key}")
+        if entry is None or entry[0] <= time.time():
+            return _MISSING
+        return entry[1]
+    
+    def put(self, namespace: str, key: str, value: Optional[str], ttl: Optional[float] = None):
+        """Cache a lookup result; None records that nothing was found"""
+        if ttl is None:
+            ttl = self.ttl if value is not None else self.negative_ttl
+        with self._lock:
+            self._entries[f"{namespace}:{key}"] = [time.time() + ttl, value]
+            self._dirty = True
+    
+    def save(self):
+        """Write the cache back to disk if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logging.getLogger(__name__).warning(f"Failed to save API cache {self.path}: {e}")
+
+
 class PaperDownloader:
-    def __init__(self, output_dir: str, use_scihub: bool = False, unpaywall_email: Optional[str] = None):
+    def __init__(self, output_dir: str, use_scihub: bool = False, unpaywall_email: Optional[str] = None,
+                 max_workers: int = 1, retry_failed: bool = False):
+        """
+        Initialize the downloader.
+        
+        Args:
+            output_dir: Directory the PDFs are saved to
+            use_scihub: Fall back to Sci-Hub when no other source works
+            unpaywall_email: Email for the Unpaywall API (skipped if None)
+            max_workers: Number of papers downloaded at the same time. Values
+                above 1 overlap the network waits of different papers, but their
+                log lines interleave.
+            retry_failed: Also try papers that failed with the same sources
+                in a run during the last 7 days (skipped by default)
+        """
         self.output_dir = Path(output_dir)
         self.use_scihub = use_scihub
         self.unpaywall_email = unpaywall_email
+        self.max_workers = max(1, max_workers)
+        self.retry_failed = retry_failed
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Set up logger with better formatting
         self.logger = logging.getLogger("PaperDownloader")
         self.logger.setLevel(logging.INFO)
         
-        # Remove any existing handlers to avoid duplicates
+        # Stop an earlier downloader's listener (writing out its records)
+        # rather than orphaning it, then remove any leftover handlers
+        global _active_log_shutdown
+        if _active_log_shutdown is not None:
+            _active_log_shutdown()
         self.logger.handlers.clear()
         
         # File handler with detailed formatting
         handler = logging.FileHandler(self.output_dir / "download.log", encoding="utf-8")
         handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
-        self.logger.addHandler(handler)
         
         # Console handler for user feedback
         console = logging.StreamHandler()
         console.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
-        self.logger.addHandler(console)
+        
+        # Workers only enqueue records; a listener thread does the file and
+        # console writes, so logging never blocks a download on I/O
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        self.logger.addHandler(queue_handler)
+        self._log_handlers = (handler, console)
+        self._log_listener = QueueListener(log_queue, *self._log_handlers, respect_handler_level=True)
+        self._log_listener.start()
+        
+        # The listener thread is a daemon: shut it down on close(), when the
+        # downloader is garbage collected, or at interpreter exit, whichever
+        # comes first, so callers that never reach close() keep their log lines
+        self._log_shutdown = _active_log_shutdown = weakref.finalize(
+            self, _shutdown_logging, self.logger, queue_handler, self._log_listener, self._log_handlers
+        )
         
         # Statistics
         self.stats = {
@@ -45,19 +320,63 @@ class PaperDownloader:
             'success': 0,
             'failed': 0,
             'skipped': 0,
+            'duplicates': 0,  # Entries resolving to the same PDF as an earlier one
             'dois_found': 0,  # DOIs found via Crossref lookup
-            'by_method': {
-                'direct_pdf': 0,
-                'arxiv': 0,
-                'unpaywall': 0,
-                'scihub': 0
-            }
+            'by_method': Counter(),  # Successes per source, e.g. 'arxiv', 'pmc'
         }
         
+        self._stats_lock = threading.Lock()  # Papers may finish on several threads
+        
         # Track failed downloads
         self.failed_papers = []
+        
+        # Names of PDFs already in output_dir (scanned once per session)
+        self._existing_pdfs: Optional[Set[str]] = None
+        
+        # Results of earlier runs' API lookups
+        self._api_cache = _ApiCache(self.output_dir / _API_CACHE_FILE)
+        
+        # Shared by all worker threads so each host sees one request stream
+        self._rate_limiter = HostRateLimiter(max_pause=_RETRY_AFTER_MAX)
+        
+        # One pooled session keeps connections (and TLS sessions) alive
+        # across the many lookups and downloads made per paper
+        self._session = requests.Session()
+        retries = _CappedRetry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF_FACTOR,
+                               status_forcelist=_RETRY_STATUSES, respect_retry_after_header=True,
+                               raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE,
+                              max_retries=retries)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Runs each paper's metadata lookups side by side (see _download_paper)
+        self._lookup_executor = ThreadPoolExecutor(max_workers=_SOURCE_LOOKUPS_PER_PAPER * self.max_workers)
 
-    def download_from_bib(self, bib_file: str):
+    def close(self):
+        """Write out pending log records and close the log file and HTTP session"""
+        self._log_shutdown()
+        self._lookup_executor.shutdown()
+        self._session.close()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def download_from_bib(self, bib_file: str, on_result: Optional[Callable[[dict, Optional[Path]], None]] = None):
+        """
+        Download PDFs for all entries of a BibTeX file.
+        
+        Args:
+            bib_file: Path to the .bib file
+            on_result: Optional callback invoked after each entry with the entry
+                and the PDF path (None if the download failed), so callers can
+                process PDFs while the rest of the batch is still downloading
+        """
         import bibtexparser
         
         # Log session start with separator
@@ -77,14 +396,22 @@ class PaperDownloader:
         self.logger.info(f"Loaded {len(papers)} papers from {bib_file}")
         self.logger.info("")
         
-        for i, entry in enumerate(papers, 1):
-            self.logger.info(f"[{i}/{len(papers)}] " + "-"*60)
-            self._download_paper(entry)
+        self._scan_existing_pdfs()
+        self._download_entries(papers, on_result)
         
         # Log summary
         self._log_summary()
+        self._flush_log()
 
-    def download_from_ris(self, ris_file: str):
+    def download_from_ris(self, ris_file: str, on_result: Optional[Callable[[dict, Optional[Path]], None]] = None):
+        """
+        Download PDFs for all entries of a RIS file.
+        
+        Args:
+            ris_file: Path to the .ris file
+            on_result: Optional callback invoked after each entry with the entry
+                and the PDF path (None if the download failed)
+        """
         import rispy
         
         # Log session start with separator
@@ -103,12 +430,230 @@ class PaperDownloader:
         self.logger.info(f"Loaded {len(entries)} papers from {ris_file}")
         self.logger.info("")
         
-        for i, entry in enumerate(entries, 1):
-            self.logger.info(f"[{i}/{len(entries)}] " + "-"*60)
-            self._download_paper(entry)
+        self._scan_existing_pdfs()
+        self._download_entries(entries, on_result)
         
         # Log summary
         self._log_summary()
+        self._flush_log()
+
+    def _flush_log(self):
+        """Wait until every queued log record has been written"""
+        if not self._log_shutdown.alive:
+            return
+        # stop() drains the queue before joining; start a fresh listener thread
+        self._log_listener.stop()
+        self._log_listener.start()
+
+    def _download_entries(self, entries: List[dict], on_result: Optional[Callable[[dict, Optional[Path]], None]]):
+        """
+        Download all entries, up to max_workers at a time.
+        
+        Each paper is I/O bound (API lookups and PDF transfers), so running
+        several at once hides their network latency. With max_workers=1 the
+        entries are processed one after another in file order.
+        
+        Entries whose PDF is already on disk are settled before any download
+        starts, and entries resolving to the same file name (e.g. the same
+        DOI in merged bibliographies) are downloaded once.
+        
+        Args:
+            entries: BibTeX or RIS entry dictionaries
+            on_result: Optional callback invoked as each entry finishes
+        """
+        try:
+            self._extract_url_ids(entries)
+            self._lookup_missing_dois(entries)
+            
+            # PDF path -> entries sharing it, in file order. Every path is
+            # resolved here once, so the workers do not rebuild them.
+            groups: Dict[Path, List[dict]] = {}
+            skipped = 0
+            for entry in entries:
+                dest_path = self._entry_dest_path(entry)
+                if self._is_downloaded(dest_path):
+                    self.logger.debug(f"SKIP: already downloaded: {dest_path.name}")
+                    skipped += 1
+                    if on_result:
+                        on_result(entry, dest_path)
+                else:
+                    groups.setdefault(dest_path, []).append(entry)
+            
+            duplicates = len(entries) - skipped - len(groups)
+            with self._stats_lock:
+                self.stats['skipped'] += skipped
+                self.stats['duplicates'] += duplicates
+            if skipped or duplicates:
+                self.logger.info(f"Skipping {skipped} already downloaded and {duplicates} duplicate entries")
+                self.logger.info("")
+            
+            total = len(groups)
+            
+            def download(i: int, dest_path: Path, entry: dict) -> Optional[Path]:
+                self.logger.info(f"[{i}/{total}] " + "-"*60)
+                return self._download_paper(entry, dest_path)
+            
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(download, i, dest_path, group[0]): group
+                           for i, (dest_path, group) in enumerate(groups.items(), 1)}
+                for future in as_completed(futures):
+                    pdf_path = future.result()
+                    if on_result:
+                        for entry in futures[future]:
+                            on_result(entry, pdf_path)
+        finally:
+            self._api_cache.save()
+    
+    def _extract_url_ids(self, entries: List[dict]):
+        """
+        Fill in arXiv IDs and PMIDs that are only present in entry URLs.
+        
+        Done once per batch, so the naming, DOI and download steps read the
+        fields instead of each matching the URL again. Only URLs on the
+        matching host are searched.
+        
+        Args:
+            entries: BibTeX or RIS entry dictionaries (updated in place)
+        """
+        for entry in entries:
+            if not entry.get("arxiv_id"):
+                arxiv_id = self._entry_arxiv_id(entry)
+                if arxiv_id:
+                    entry["arxiv_id"] = arxiv_id
+            if not (entry.get("pmid") or entry.get("PMID")):
+                pmid = self._entry_pmid(entry)
+                if pmid:
+                    entry["pmid"] = pmid
+    
+    def _lookup_missing_dois(self, entries: List[dict]):
+        """
+        Look up DOIs by title for all entries that need one, concurrently.
+        
+        Entries without a DOI or arXiv ID would otherwise each wait for their
+        own Crossref search inside the download loop. Found DOIs are stored
+        in the entries as 'doi'.
+        
+        Args:
+            entries: BibTeX or RIS entry dictionaries (updated in place)
+        """
+        pending = []
+        for entry in entries:
+            title = entry.get("title") or entry.get("TI")
+            if not title or entry.get("doi") or entry.get("DO") or self._entry_arxiv_id(entry):
+                continue
+            pending.append((entry, title))
+        
+        if not pending:
+            return
+        
+        self.logger.info(f"Looking up DOIs by title for {len(pending)} entries...")
+        with ThreadPoolExecutor(max_workers=_DOI_LOOKUP_WORKERS) as executor:
+            dois = executor.map(lambda item: self._lookup_doi_from_title(item[1]), pending)
+            found = 0
+            for (entry, _), doi in zip(pending, dois):
+                if doi:
+                    entry["doi"] = doi
+                    found += 1
+        self.logger.info(f"Found {found} of {len(pending)} DOIs")
+        self.logger.info("")
+    
+    def _optional_sources(self) -> List[str]:
+        """Opt-in sources enabled for this downloader (the rest always run)"""
+        sources = ['base']
+        if self.unpaywall_email:
+            sources.append('unpaywall')
+        if self.use_scihub:
+            sources.append('scihub')
+        return sources
+    
+    def _entry_dest_path(self, entry: dict) -> Path:
+        """PDF path of an entry, named after its DOI, arXiv ID or title"""
+        title = entry.get("title") or entry.get("TI") or "Unknown"
+        paper_id = entry.get("doi") or entry.get("DO") or self._entry_arxiv_id(entry) or title
+        return self.output_dir / f"{self._safe_filename(paper_id)}.pdf"
+    
+    def _entry_arxiv_id(self, entry: dict) -> Optional[str]:
+        """arXiv ID of an entry, from its arxiv_id field or an arXiv URL"""
+        arxiv_id = entry.get("arxiv_id")
+        if not arxiv_id:
+            url = entry.get("url") or entry.get("UR")
+            match = _ARXIV_URL_RE.search(url) if url and "arxiv.org" in url else None
+            if match:
+                arxiv_id = match.group(1)
+        return arxiv_id
+    
+    def _note_transient_error(self, what: str):
+        """Record a failure worth retrying in a later run for the current paper"""
+        errors = _transient_errors.get()
+        if errors is not None:
+            errors.append(what)
+    
+    def _submit_lookup(self, fn: Callable, *args):
+        """Run fn on the lookup pool, recording transient errors for the current paper"""
+        return self._lookup_executor.submit(contextvars.copy_context().run, fn, *args)
+    
+    def _entry_pmid(self, entry: dict) -> Optional[str]:
+        """PubMed ID of an entry, from its PMID field or a PubMed URL"""
+        pmid = entry.get("pmid") or entry.get("PMID")
+        if not pmid:
+            url = entry.get("url") or entry.get("UR")
+            match = _PUBMED_URL_RE.search(url) if url and "pubmed.ncbi.nlm.nih.gov" in url else None
+            if match:
+                pmid = match.group(1)
+        return pmid
+    
+    def _count(self, key: str):
+        """Increment a session statistic"""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
+    def _count_success(self, method: str):
+        """Count a successful download and the method that produced it"""
+        with self._stats_lock:
+            self.stats['success'] += 1
+            self.stats['by_method'][method] += 1
+    
+    def _scan_existing_pdfs(self):
+        """
+        List the PDFs already in the output directory with a single scan.
+        
+        Skip checks then become set lookups instead of one stat() call per
+        paper, which matters when output_dir is on a network share.
+        """
+        self._existing_pdfs = {p.name for p in self.output_dir.glob("*.pdf")}
+    
+    def _is_downloaded(self, dest_path: Path) -> bool:
+        """Check whether dest_path was already downloaded"""
+        if self._existing_pdfs is None:
+            return dest_path.exists()
+        return dest_path.name in self._existing_pdfs
+    
+    def _mark_downloaded(self, dest_path: Path):
+        """Record a newly saved PDF so later entries with the same name are skipped"""
+        if self._existing_pdfs is not None:
+            self._existing_pdfs.add(dest_path.name)
+
+    def _get(self, url: str, **kwargs):
+        """
+        GET a URL on the shared session through the per-host rate limiter.
+        
+        Args:
+            url: URL to fetch
+            **kwargs: Passed on to requests.Session.get
+            
+        Returns:
+            The requests.Response
+        """
+        self._rate_limiter.acquire(url)
+        try:
+            r = self._session.get(url, **kwargs)
+        except requests.exceptions.RequestException:
+            self._note_transient_error(url)
+            raise
+        if r.status_code == 429 or r.status_code >= 500:
+            self._note_transient_error(url)
+        self._rate_limiter.update_from_headers(url, r.headers)
+        return r
 
     def _lookup_doi_from_title(self, title: str) -> Optional[str]:
         """
@@ -120,24 +665,33 @@ class PaperDownloader:
         Returns:
             DOI string if found, None otherwise
         """
-        import requests
-        
         if not title or title == "Unknown":
             return None
         
+        cache_key = title.strip().lower()
+        doi = self._api_cache.get('title_doi', cache_key)
+        if doi is not _MISSING:
+            if doi:
+                self.logger.info(f"  → Found DOI via Crossref (cached): {doi}")
+                self._count('dois_found')
+            return doi
+        
         try:
             # Use Crossref API to search by title
             api_url = "https://api.crossref.org/works"
             params = {
                 'query.bibliographic': title,
                 'rows': 1,
-                'select': 'DOI,title,score'
+                # 'link' comes along so a PDF link found here spares
+                # _get_crossref_pdf a second request for the same work
+                'select': 'DOI,title,score,link'
             }
             
-            r = requests.get(api_url, params=params, timeout=10)
+            r = self._get(api_url, params=params, timeout=10)
             if r.status_code == 200:
                 data = r.json()
                 items = data.get('message', {}).get('items', [])
+                doi = None
                 
                 if items:
                     item = items[0]
@@ -149,44 +703,69 @@ class PaperDownloader:
                         
                         self.logger.info(f"  → Found DOI via Crossref: {doi}")
                         self.logger.debug(f"     Match score: {score}, Title: {returned_title[:60]}")
-                        self.stats['dois_found'] += 1
-                        return doi
+                        self._count('dois_found')
+                        
+                        # Without 'resource' (not selectable in searches) a
+                        # missing link does not prove there is no PDF, so
+                        # only a found link is cached
+                        pdf_url = _crossref_pdf_link(item)
+                        if doi and pdf_url:
+                            self._api_cache.put('crossref_pdf', doi, pdf_url)
                     else:
                         self.logger.debug(f"  → Crossref match score too low ({score}), skipping")
+                
+                self._api_cache.put('title_doi', cache_key, doi)
+                return doi
         except Exception as e:
             self.logger.debug(f"  → Crossref lookup error: {e}")
         
         return None
 
-    def _download_paper(self, entry: dict):
+    def _download_paper(self, entry: dict, dest_path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Try every source in turn until the paper's PDF is saved.
+        
+        Args:
+            entry: BibTeX or RIS entry dictionary
+            dest_path: PDF path already resolved (and checked for) by the batch
+                pre-pass; None derives it here and skips existing files
+        
+        Returns:
+            Path of the PDF (also when it was already downloaded), or None on failure
+        """
         title = entry.get("title") or entry.get("TI") or "Unknown"
         doi = entry.get("doi") or entry.get("DO")
         url = entry.get("url") or entry.get("UR")
-        arxiv_id = entry.get("arxiv_id")
+        url_lower = url.lower() if url else ""  # Lower-cased once for the host checks below
+        # Also takes the arXiv ID from the URL (for @misc entries from arXiv)
+        arxiv_id = self._entry_arxiv_id(entry)
+        pmid = self._entry_pmid(entry)  # Already filled in by a batch pre-pass
         
-        # Extract arXiv ID from URL if present (for @misc entries from arXiv)
-        if not arxiv_id and url and "arxiv.org" in url.lower():
-            # Extract arXiv ID from URL
-            import re
-            match = re.search(r'arxiv\.org/(?:abs|pdf)/(\d+\.\d+)', url)
-            if match:
-                arxiv_id = match.group(1)
-        
-        # If no DOI, try to look it up via Crossref using the title
+        # If no DOI (and the pre-pass did not find one), try Crossref by title
         if not doi and not arxiv_id and title != "Unknown":
             doi = self._lookup_doi_from_title(title)
         
         pdf_url = None
-        paper_id = doi or arxiv_id or title or url
-        safe_name = self._safe_filename(paper_id)
-        dest_path = self.output_dir / f"{safe_name}.pdf"
+        if dest_path is None:
+            dest_path = self.output_dir / f"{self._safe_filename(doi or arxiv_id or title)}.pdf"
+            
+            # Skip if already downloaded
+            if self._is_downloaded(dest_path):
+                self.logger.info(f"SKIP: {title[:80]}")
+                self.logger.info(f"  → Already downloaded: {dest_path.name}")
+                self._count('skipped')
+                return dest_path
         
-        # Skip if already downloaded
-        if dest_path.exists():
+        # Skip papers that recently failed with every source enabled now
+        sources = self._optional_sources()
+        failed_with = self._api_cache.get('failed', dest_path.stem)
+        if (not self.retry_failed and isinstance(failed_with, str)
+                and set(sources) <= set(failed_with.split(','))):
             self.logger.info(f"SKIP: {title[:80]}")
-            self.logger.info(f"  → Already downloaded: {dest_path.name}")
-            self.stats['skipped'] += 1
-            return
+            self.logger.info(f"  → Failed with the same sources in a recent run (set retry_failed to try again)")
+            self._count('failed')
+            self._store_failed_paper(entry)
+            return None
         
         self.logger.info(f"PROCESSING: {title[:80]}")
         if doi:
@@ -196,212 +775,226 @@ class PaperDownloader:
         if url and not arxiv_id:
             self.logger.info(f"  URL: {url[:100]}")
         
-        # 1. Try direct PDF link
-        if url and url.endswith(".pdf"):
-            self.logger.info(f"  → Trying direct PDF link...")
-            pdf_url = url
-            if self._download_pdf(pdf_url, dest_path):
-                self.logger.info(f"  ✓ SUCCESS via direct PDF link")
-                self.stats['success'] += 1
-                self.stats['by_method']['direct_pdf'] += 1
-                return
-        
-        # 2. Try arXiv direct (check arXiv ID first, then DOI, then URL)
-        if arxiv_id or (doi and "arxiv" in doi.lower()) or (url and "arxiv" in url.lower()):
-            self.logger.info(f"  → Trying arXiv...")
-            pdf_url = self._get_arxiv_pdf(entry)
-            if pdf_url and self._download_pdf(pdf_url, dest_path):
-                self.logger.info(f"  ✓ SUCCESS via arXiv")
-                self.stats['success'] += 1
-                self.stats['by_method']['arxiv'] += 1
-                return
-        
-        # 2.5. Try bioRxiv/medRxiv (common for biomedical preprints)
-        if url and ("biorxiv.org" in url.lower() or "medrxiv.org" in url.lower()):
-            self.logger.info(f"  → Trying bioRxiv/medRxiv...")
-            pdf_url = self._get_biorxiv_pdf(url)
-            if pdf_url and self._download_pdf(pdf_url, dest_path):
-                self.logger.info(f"  ✓ SUCCESS via bioRxiv/medRxiv")
-                self.stats['success'] += 1
-                self.stats['by_method']['biorxiv'] = self.stats['by_method'].get('biorxiv', 0) + 1
-                return
-        
-        # 3. Try Unpaywall (open access)
-        if doi and self.unpaywall_email:
-            self.logger.info(f"  → Checking Unpaywall...")
-            pdf_url = self._get_unpaywall_pdf(doi)
-            if pdf_url:
-                self.logger.info(f"  → Found OA version: {pdf_url[:80]}")
-                if self._download_pdf(pdf_url, dest_path):
-                    self.logger.info(f"  ✓ SUCCESS via Unpaywall")
-                    self.stats['success'] += 1
-                    self.stats['by_method']['unpaywall'] += 1
-                    return
-            else:
-                self.logger.info(f"  → No open access version found")
-        elif doi and not self.unpaywall_email:
-            self.logger.warning(f"  ⚠ Unpaywall email not set, skipping OA check")
-        
-        # 3.2. Try Crossref API for full-text links
-        if doi:
-            self.logger.info(f"  → Checking Crossref for full-text...")
-            pdf_url = self._get_crossref_pdf(doi, title)
-            if pdf_url:
-                self.logger.info(f"  → Found via Crossref: {pdf_url[:80]}")
+        # Pure API lookups (each returns a PDF URL or None), started together
+        # once the local sources below have failed
+        lookups = {}
+        errors: List[str] = []
+        errors_token = _transient_errors.set(errors)
+        try:
+            # 1. Try direct PDF link
+            if url and url.endswith(".pdf"):
+                self.logger.info(f"  → Trying direct PDF link...")
+                pdf_url = url
                 if self._download_pdf(pdf_url, dest_path):
-                    self.logger.info(f"  ✓ SUCCESS via Crossref")
-                    self.stats['success'] += 1
-                    self.stats['by_method']['crossref'] = self.stats['by_method'].get('crossref', 0) + 1
-                    return
-        
-        # 3.5. Try PubMed Central (if PMID or PMC ID available)
-        pmid = entry.get("pmid") or entry.get("PMID")
-        if pmid or (url and "pubmed.ncbi.nlm.nih.gov" in url):
-            self.logger.info(f"  → Checking PubMed Central...")
-            if not pmid and url:
-                # Extract PMID from URL
-                import re
-                match = re.search(r'pubmed\.ncbi\.nlm\.nih\.gov/(\d+)', url)
-                if match:
-                    pmid = match.group(1)
+                    self.logger.info(f"  ✓ SUCCESS via direct PDF link")
+                    self._count_success('direct_pdf')
+                    return dest_path
+            
+            # 2. Try arXiv direct (check arXiv ID first, then DOI, then URL)
+            if arxiv_id or (doi and "arxiv" in doi.lower()) or "arxiv" in url_lower:
+                self.logger.info(f"  → Trying arXiv...")
+                pdf_url = self._get_arxiv_pdf(entry)
+                if pdf_url and self._download_pdf(pdf_url, dest_path):
+                    self.logger.info(f"  ✓ SUCCESS via arXiv")
+                    self._count_success('arxiv')
+                    return dest_path
+            
+            # 2.5. Try bioRxiv/medRxiv (common for biomedical preprints)
+            if "biorxiv.org" in url_lower or "medrxiv.org" in url_lower:
+                self.logger.info(f"  → Trying bioRxiv/medRxiv...")
+                pdf_url = self._get_biorxiv_pdf(url)
+                if pdf_url and self._download_pdf(pdf_url, dest_path):
+                    self.logger.info(f"  ✓ SUCCESS via bioRxiv/medRxiv")
+                    self._count_success('biorxiv')
+                    return dest_path
             
+            # The lookups' latencies overlap; their URLs are still tried in
+            # the order of the source ladder below
+            if doi and self.unpaywall_email:
+                lookups['unpaywall'] = self._submit_lookup(self._get_unpaywall_pdf, doi)
+            if doi:
+                lookups['crossref'] = self._submit_lookup(self._get_crossref_pdf, doi, title)
             if pmid:
-                pdf_url = self._get_pmc_pdf(pmid)
+                lookups['pmc'] = self._submit_lookup(self._get_pmc_pdf, pmid)
+            
+            # 3. Try Unpaywall (open access)
+            if 'unpaywall' in lookups:
+                self.logger.info(f"  → Checking Unpaywall...")
+                pdf_url = lookups['unpaywall'].result()
+                if pdf_url:
+                    self.logger.info(f"  → Found OA version: {pdf_url[:80]}")
+                    if self._download_pdf(pdf_url, dest_path):
+                        self.logger.info(f"  ✓ SUCCESS via Unpaywall")
+                        self._count_success('unpaywall')
+                        return dest_path
+                else:
+                    self.logger.info(f"  → No open access version found")
+            elif doi and not self.unpaywall_email:
+                self.logger.warning(f"  ⚠ Unpaywall email not set, skipping OA check")
+            
+            # 3.2. Try Crossref API for full-text links
+            if 'crossref' in lookups:
+                self.logger.info(f"  → Checking Crossref for full-text...")
+                pdf_url = lookups['crossref'].result()
+                if pdf_url:
+                    self.logger.info(f"  → Found via Crossref: {pdf_url[:80]}")
+                    if self._download_pdf(pdf_url, dest_path):
+                        self.logger.info(f"  ✓ SUCCESS via Crossref")
+                        self._count_success('crossref')
+                        return dest_path
+            
+            # 3.5. Try PubMed Central (if PMID available)
+            if 'pmc' in lookups:
+                self.logger.info(f"  → Checking PubMed Central...")
+                pdf_url = lookups['pmc'].result()
                 if pdf_url and self._download_pdf(pdf_url, dest_path):
                     self.logger.info(f"  ✓ SUCCESS via PubMed Central")
-                    self.stats['success'] += 1
-                    self.stats['by_method']['pmc'] = self.stats['by_method'].get('pmc', 0) + 1
-                    return
-        
-        # 4. Try common publisher patterns (MDPI, Frontiers, etc.)
-        if url and doi:
-            self.logger.info(f"  → Trying publisher-specific patterns...")
-            pdf_url = self._get_publisher_pdf(url, doi)
-            if pdf_url and self._download_pdf(pdf_url, dest_path):
-                self.logger.info(f"  ✓ SUCCESS via publisher pattern")
-                self.stats['success'] += 1
-                self.stats['by_method']['publisher'] = self.stats['by_method'].get('publisher', 0) + 1
-                return
-        
-        # 4.5. Try ResearchGate and Academia.edu (many authors upload there)
-        if title and title != "Unknown":
-            self.logger.info(f"  → Checking ResearchGate and Academia.edu...")
-            pdf_url = self._get_academic_social_pdf(title, authors=entry.get("author", ""))
-            if pdf_url:
-                self.logger.info(f"  → Found on academic social network: {pdf_url[:80]}")
-                if self._download_pdf(pdf_url, dest_path):
-                    self.logger.info(f"  ✓ SUCCESS via ResearchGate/Academia.edu")
-                    self.stats['success'] += 1
-                    self.stats['by_method']['researchgate'] = self.stats['by_method'].get('researchgate', 0) + 1
-                    return
-        
-        # 4.6. Try scraping HTML page for PDF link
-        if url:
-            self.logger.info(f"  → Trying to scrape PDF link from page...")
-            pdf_url = self._try_scrape_pdf_link(url)
-            if pdf_url:
-                self.logger.info(f"  → Found PDF link: {pdf_url[:80]}")
-                if self._download_pdf(pdf_url, dest_path):
-                    self.logger.info(f"  ✓ SUCCESS via HTML scraping")
-                    self.stats['success'] += 1
-                    self.stats['by_method']['scraping'] = self.stats['by_method'].get('scraping', 0) + 1
-                    return
-        
-        # 5. Fallback: Sci-Hub (if enabled)
-        if self.use_scihub and doi:
-            self.logger.info(f"  → Trying Sci-Hub...")
-            pdf_path = self._get_scihub_pdf(doi, dest_path)
-            if pdf_path and dest_path.exists():
-                self.logger.info(f"  ✓ SUCCESS via Sci-Hub")
-                self.stats['success'] += 1
-                self.stats['by_method']['scihub'] += 1
-                return
-        
-        # 6. Log failure and store paper info
-        self.logger.error(f"  ✗ FAILED: Could not download from any source")
-        if not doi and not arxiv_id:
-            self.logger.error(f"  → No DOI or arXiv ID available")
-        self.stats['failed'] += 1
-        
-        # Store failed paper entry for later export
-        self._store_failed_paper(entry)
-
-    def _download_pdf(self, pdf_url: str, dest_path: Path, retry_count: int = 0, max_retries: int = 3) -> bool:
-        import requests
-        import time
-        
-        try:
-            self.logger.info(f"Downloading from: {pdf_url}")
+                    self._count_success('pmc')
+                    return dest_path
             
-            # Comprehensive headers that mimic real browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'application/pdf,application/octet-stream,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Referer': 'https://www.google.com/',
-            }
+            # 4. Try common publisher patterns (MDPI, Frontiers, etc.)
+            if doi:
+                self.logger.info(f"  → Trying publisher-specific patterns...")
+                pdf_url = self._get_publisher_pdf(url, doi)
+                if pdf_url and self._download_pdf(pdf_url, dest_path):
+                    self.logger.info(f"  ✓ SUCCESS via publisher pattern")
+                    self._count_success('publisher')
+                    return dest_path
+            
+            # 4.5. Try ResearchGate and Academia.edu (many authors upload there)
+            if title and title != "Unknown":
+                self.logger.info(f"  → Checking ResearchGate and Academia.edu...")
+                pdf_url = self._get_academic_social_pdf(title, authors=entry.get("author", ""))
+                if pdf_url:
+                    self.logger.info(f"  → Found on academic social network: {pdf_url[:80]}")
+                    if self._download_pdf(pdf_url, dest_path):
+                        self.logger.info(f"  ✓ SUCCESS via ResearchGate/Academia.edu")
+                        self._count_success('researchgate')
+                        return dest_path
+            
+            # 4.6. Try scraping HTML page for PDF link
+            if url:
+                self.logger.info(f"  → Trying to scrape PDF link from page...")
+                pdf_url = self._try_scrape_pdf_link(url)
+                if pdf_url:
+                    self.logger.info(f"  → Found PDF link: {pdf_url[:80]}")
+                    if self._download_pdf(pdf_url, dest_path):
+                        self.logger.info(f"  ✓ SUCCESS via HTML scraping")
+                        self._count_success('scraping')
+                        return dest_path
             
-            # Special handling for arXiv
-            if 'arxiv.org' in pdf_url.lower():
-                # arXiv sometimes redirects, add timeout to avoid hangs
-                r = requests.get(pdf_url, timeout=15, headers=headers, allow_redirects=True, stream=True)
+            # 5. Fallback: Sci-Hub (if enabled)
+            if self.use_scihub and doi:
+                self.logger.info(f"  → Trying Sci-Hub...")
+                pdf_path = self._get_scihub_pdf(doi, dest_path)
+                if pdf_path and dest_path.exists():
+                    self._mark_downloaded(dest_path)
+                    self.logger.info(f"  ✓ SUCCESS via Sci-Hub")
+                    self._count_success('scihub')
+                    return dest_path
+            
+            # 6. Log failure and store paper info
+            self.logger.error(f"  ✗ FAILED: Could not download from any source")
+            if not doi and not arxiv_id:
+                self.logger.error(f"  → No DOI or arXiv ID available")
+            self._count('failed')
+            if errors:
+                self.logger.info(f"  → {len(errors)} request(s) failed temporarily, will retry next run")
             else:
-                r = requests.get(pdf_url, timeout=30, headers=headers, allow_redirects=True, stream=True)
+                self._api_cache.put('failed', dest_path.stem, ','.join(sources), ttl=_FAILED_RETRY_TTL)
             
-            if r.status_code == 200:
-                content_type = r.headers.get('content-type', '').lower()
-                
-                # Verify it's actually a PDF
-                if 'application/pdf' in content_type or (r.content and r.content[:4] == b'%PDF'):
-                    with open(dest_path, "wb") as f:
-                        f.write(r.content)
-                    file_size = dest_path.stat().st_size
-                    self.logger.info(f"Successfully saved PDF ({file_size} bytes)")
+            # Store failed paper entry for later export
+            self._store_failed_paper(entry)
+            return None
+        finally:
+            # Drop lookups that have not started, and let running ones finish
+            # so their log lines stay in this paper's block
+            for future in lookups.values():
+                future.cancel()
+            wait(lookups.values())
+            _transient_errors.reset(errors_token)
+
+    def _download_pdf(self, pdf_url: str, dest_path: Path) -> bool:
+        self.logger.info(f"Downloading from: {pdf_url}")
+        
+        # arXiv sometimes redirects, use a shorter timeout to avoid hangs
+        timeout = 15 if 'arxiv.org' in pdf_url.lower() else 30
+        
+        # Stream into a temporary file and move it into place only once it is
+        # complete and checked, so a dropped connection never leaves a
+        # truncated PDF that later runs would treat as downloaded
+        part_path = dest_path.with_suffix('.pdf.part')
+        
+        try:
+            # Closing the response on every path hands its connection back to
+            # the session's pool, also when the body is left unread
+            with self._get(pdf_url, timeout=timeout, headers=_PDF_REQUEST_HEADERS, allow_redirects=True, stream=True) as r:
+                if r.status_code == 200:
+                    content_type = r.headers.get('content-type', '').lower()
                     
-                    # Verify file is not corrupt (PDF should be > 5KB)
-                    if file_size > 5000:
-                        return True
+                    # Sniff only the first few KB to check the PDF signature, so
+                    # a rejected response costs little; a real PDF is then
+                    # streamed to disk instead of being held in memory
+                    first_chunk = next(r.iter_content(chunk_size=_SNIFF_SIZE), b'')
+                    
+                    # Verify it's actually a PDF
+                    if 'application/pdf' in content_type or first_chunk[:4] == _PDF_MAGIC:
+                        with open(part_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                            f.write(first_chunk)
+                            for chunk in r.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                        file_size = part_path.stat().st_size
+                        
+                        # Verify file is not corrupt (PDF should be > 5KB)
+                        if file_size > 5000:
+                            os.replace(part_path, dest_path)
+                            self.logger.info(f"Successfully saved PDF ({file_size} bytes)")
+                            self._mark_downloaded(dest_path)
+                            return True
+                        else:
+                            self.logger.warning(f"PDF file too small ({file_size} bytes), likely corrupt")
+                            return False
                     else:
-                        self.logger.warning(f"PDF file too small ({file_size} bytes), likely corrupt")
-                        dest_path.unlink()
-                        return False
-                else:
-                    self.logger.warning(f"Downloaded content is not a PDF (content-type: {content_type})")
-            elif r.status_code == 403:
-                self.logger.warning(f"HTTP 403 Forbidden - likely IP blocked or requires authentication")
-            elif r.status_code == 429:
-                # Too many requests - retry with backoff
-                if retry_count < max_retries:
-                    wait_time = min(2 ** retry_count, 10)  # Exponential backoff: 1, 2, 4, 8, 10 seconds
-                    self.logger.warning(f"HTTP 429 Too Many Requests - retrying in {wait_time}s ({retry_count + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    return self._download_pdf(pdf_url, dest_path, retry_count + 1, max_retries)
-                else:
+                        self.logger.warning(f"Downloaded content is not a PDF (content-type: {content_type})")
+                elif r.status_code == 403:
+                    self.logger.warning(f"HTTP 403 Forbidden - likely IP blocked or requires authentication")
+                elif r.status_code == 429:
+                    # The session's retry policy has already waited and retried
                     self.logger.error(f"HTTP 429 - max retries exceeded")
-            else:
-                self.logger.warning(f"HTTP {r.status_code} for URL: {pdf_url}")
+                else:
+                    self.logger.warning(f"HTTP {r.status_code} for URL: {pdf_url}")
         except requests.exceptions.Timeout:
             self.logger.warning(f"Request timeout - server took too long to respond")
         except requests.exceptions.ConnectionError:
             self.logger.warning(f"Connection error - check internet or server availability")
+        except requests.exceptions.RequestException as e:
+            # E.g. the connection dropped while the body was streaming
+            self.logger.error(f"PDF download error: {pdf_url} - {e}")
+            self._note_transient_error(pdf_url)
         except Exception as e:
             self.logger.error(f"PDF download error: {pdf_url} - {e}")
+        finally:
+            # Left behind only by a failed or rejected transfer
+            if part_path.exists():
+                part_path.unlink()
         return False
 
     def _get_unpaywall_pdf(self, doi: str) -> Optional[str]:
-        import requests
+        cached = self._api_cache.get('unpaywall', doi)
+        if cached is not _MISSING:
+            return cached
+        
         api = f"https://api.unpaywall.org/v2/{doi}?email={self.unpaywall_email}"
         try:
-            r = requests.get(api, timeout=15)
+            r = self._get(api, timeout=15)
             if r.status_code == 200:
                 data = r.json()
                 oa_location = data.get("best_oa_location")
-                if oa_location and oa_location.get("url_for_pdf"):
-                    return oa_location["url_for_pdf"]
+                pdf_url = oa_location.get("url_for_pdf") if oa_location else None
+                self._api_cache.put('unpaywall', doi, pdf_url or None)
+                return pdf_url or None
+            if r.status_code == 404:
+                self._api_cache.put('unpaywall', doi, None)
         except Exception as e:
             self.logger.error(f"Unpaywall error for DOI {doi}: {e}")
         return None
@@ -411,30 +1004,38 @@ class PaperDownloader:
         Check Crossref API for full-text links and license information.
         Some publishers provide direct PDF links via Crossref.
         """
-        import requests
+        cached = self._api_cache.get('crossref_pdf', doi)
+        if cached is not _MISSING:
+            if cached:
+                self.logger.info(f"  → Found Crossref PDF link (cached): {cached[:80]}")
+            return cached
+        
         try:
             # Query Crossref for this DOI
             api_url = f"https://api.crossref.org/works/{doi}"
-            r = requests.get(api_url, timeout=10)
+            r = self._get(api_url, timeout=10)
             
             if r.status_code == 200:
                 data = r.json().get('message', {})
                 
                 # Check for link information
-                links = data.get('link', [])
-                for link in links:
-                    if link.get('content-type') == 'application/pdf':
-                        url = link.get('URL')
-                        if url:
-                            self.logger.info(f"  → Found Crossref PDF link: {url[:80]}")
-                            return url
+                url = _crossref_pdf_link(data)
+                if url:
+                    self.logger.info(f"  → Found Crossref PDF link: {url[:80]}")
+                    self._api_cache.put('crossref_pdf', doi, url)
+                    return url
                 
                 # Check for resource links
                 resource = data.get('resource', {})
                 primary_url = resource.get('primary', {}).get('URL')
                 if primary_url and '.pdf' in primary_url.lower():
                     self.logger.info(f"  → Found Crossref resource: {primary_url[:80]}")
+                    self._api_cache.put('crossref_pdf', doi, primary_url)
                     return primary_url
+                
+                self._api_cache.put('crossref_pdf', doi, None)
+            elif r.status_code == 404:
+                self._api_cache.put('crossref_pdf', doi, None)
                     
         except Exception as e:
             self.logger.debug(f"Crossref full-text lookup error for DOI {doi}: {e}")
@@ -446,10 +1047,6 @@ class PaperDownloader:
         Try to find paper on academic social networks like ResearchGate and Academia.edu.
         Many researchers upload their papers there for sharing.
         """
-        import requests
-        import re
-        from urllib.parse import quote
-        
         try:
             # Clean title for search
             search_title = title[:80].strip()
@@ -461,17 +1058,12 @@ class PaperDownloader:
             # Try ResearchGate
             try:
                 rg_url = f"https://www.researchgate.net/publication/search?q={search_query}"
-                r = requests.get(rg_url, timeout=10, headers=headers)
+                r = self._get(rg_url, timeout=10, headers=headers)
                 
                 if r.status_code == 200 and 'researchgate.net' in r.url:
                     # Look for PDF download links
-                    pdf_patterns = [
-                        r'href=["\']([^"\']*(?:download|pdf)[^"\']*\.pdf[^"\']*)["\']',
-                        r'"fullText"["\']?\s*:\s*"([^"]+\.pdf[^"]*)"',
-                        r'data-ua-action-data="([^"]*\.pdf[^"]*)"'
-                    ]
-                    for pattern in pdf_patterns:
-                        match = re.search(pattern, r.text)
+                    for pattern in _RESEARCHGATE_PDF_PATTERNS:
+                        match = pattern.search(r.text)
                         if match:
                             pdf_url = match.group(1)
                             if not pdf_url.startswith('http'):
@@ -527,14 +1119,12 @@ class PaperDownloader:
         bioRxiv and medRxiv have very predictable PDF URLs.
         """
         try:
-            import re
-            
             # bioRxiv/medRxiv URLs look like:
             # https://www.biorxiv.org/content/10.1101/2021.01.01.000001v1
             # https://www.medrxiv.org/content/10.1101/2021.01.01.000001v1
             
             # Extract DOI pattern
-            match = re.search(r'/(10\.1101/[\d.]+)(v\d+)?', url)
+            match = _BIORXIV_DOI_RE.search(url)
             if match:
                 doi_part = match.group(1)
                 version = match.group(2) or 'v1'  # Default to v1 if no version
@@ -561,11 +1151,10 @@ class PaperDownloader:
         PMC provides free full-text access for many papers.
         Also tries Europe PMC as fallback.
         """
-        import requests
         try:
             # First, check if paper is available in PMC
             pmc_api = f"https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/?ids={pmid}&format=json"
-            r = requests.get(pmc_api, timeout=10)
+            r = self._get(pmc_api, timeout=10)
             
             if r.status_code == 200:
                 data = r.json()
@@ -600,7 +1189,6 @@ class PaperDownloader:
         Try to get PDF from Europe PubMed Central.
         Europe PMC often has papers not in US PMC.
         """
-        import requests
         try:
             # Check Europe PMC for full text availability
             api_url = f"https://www.ebi.ac.uk/europepmc/webservices/rest/search"
@@ -610,7 +1198,7 @@ class PaperDownloader:
                 'resultType': 'core'
             }
             
-            r = requests.get(api_url, params=params, timeout=10)
+            r = self._get(api_url, params=params, timeout=10)
             if r.status_code == 200:
                 data = r.json()
                 results = data.get('resultList', {}).get('result', [])
@@ -634,74 +1222,108 @@ class PaperDownloader:
         
         return None
     
-    def _get_publisher_pdf(self, url: str, doi: str) -> Optional[str]:
+    # Publisher host (or parent domain) -> method building the PDF URL
+    _PUBLISHER_HANDLERS = {
+        'mdpi.com': '_mdpi_pdf_url',
+        'frontiersin.org': '_frontiers_pdf_url',
+        'nature.com': '_nature_pdf_url',
+        'ieeexplore.ieee.org': '_ieee_pdf_url',
+        'sciencedirect.com': '_sciencedirect_pdf_url',
+        'springer.com': '_springer_pdf_url',
+        'plos.org': '_plos_pdf_url',
+        'plosone.org': '_plos_pdf_url',
+    }
+    
+    def _get_publisher_pdf(self, url: Optional[str], doi: str) -> Optional[str]:
         """
         Try to construct PDF URL from common publisher patterns.
         Many publishers have predictable PDF URL structures.
-        """
-        url_lower = url.lower()
-        
-        # MDPI (mdpi.com)
-        if "mdpi.com" in url_lower:
-            # Pattern: https://www.mdpi.com/XXXX/pdf
-            if "/pdf" not in url_lower:
-                pdf_url = url.rstrip('/') + '/pdf'
-                self.logger.info(f"  → Trying MDPI pattern: {pdf_url[:80]}")
-                return pdf_url
-        
-        # Frontiers (frontiersin.org)
-        elif "frontiersin.org" in url_lower:
-            # Pattern: add /pdf to the end
-            if "/pdf" not in url_lower and "/full" in url_lower:
-                pdf_url = url.replace('/full', '/pdf')
-                self.logger.info(f"  → Trying Frontiers pattern: {pdf_url[:80]}")
-                return pdf_url
-        
-        # Nature (nature.com)
-        elif "nature.com" in url_lower:
-            # Pattern: replace /articles/ with /articles/
-            if ".pdf" not in url_lower:
-                pdf_url = url.rstrip('/') + '.pdf'
-                self.logger.info(f"  → Trying Nature pattern: {pdf_url[:80]}")
-                return pdf_url
         
-        # IEEE (ieeexplore.ieee.org)
-        elif "ieeexplore.ieee.org" in url_lower:
-            # Extract document ID and try to build PDF URL
-            import re
-            match = re.search(r'/document/(\d+)', url)
-            if match:
-                doc_id = match.group(1)
-                pdf_url = f"https://ieeexplore.ieee.org/stampPDF/getPDF.jsp?tp=&arnumber={doc_id}"
-                self.logger.info(f"  → Trying IEEE pattern: {pdf_url[:80]}")
-                return pdf_url
-        
-        # ScienceDirect (sciencedirect.com)
-        elif "sciencedirect.com" in url_lower:
-            # Try to use DOI-based PDF access
-            if doi:
-                # Pattern: https://www.sciencedirect.com/science/article/pii/XXXXX/pdfft
-                if "/pii/" in url_lower:
-                    pdf_url = url.split('?')[0].rstrip('/') + '/pdfft?isDTMRedir=true&download=true'
-                    self.logger.info(f"  → Trying ScienceDirect pattern: {pdf_url[:80]}")
-                    return pdf_url
+        The URL host is parsed once and looked up in _PUBLISHER_HANDLERS,
+        from the full host name down to its parent domains. If that gives
+        nothing (no URL, or e.g. a doi.org link), the PDF URL is built from
+        the DOI prefix, which saves following the DOI redirect.
+        """
+        if url:
+            labels = (urlparse(url).hostname or "").split('.')
+            for i in range(len(labels) - 1):
+                handler = self._PUBLISHER_HANDLERS.get('.'.join(labels[i:]))
+                if handler:
+                    pdf_url = getattr(self, handler)(url, url.lower(), doi)
+                    if pdf_url:
+                        return pdf_url
+                    break
         
-        # Springer (springer.com, link.springer.com)
-        elif "springer.com" in url_lower:
-            if "/chapter/" in url_lower or "/article/" in url_lower:
-                # Try adding .pdf extension
-                pdf_url = url.split('?')[0].rstrip('/') + '.pdf'
-                self.logger.info(f"  → Trying Springer pattern: {pdf_url[:80]}")
+        return self._doi_pdf_url(doi)
+    
+    def _doi_pdf_url(self, doi: str) -> Optional[str]:
+        """Build the PDF URL straight from the DOI for publishers in _DOI_PDF_PATTERNS"""
+        doi_lower = doi.lower()
+        for prefix, template in _DOI_PDF_PATTERNS:
+            if doi_lower.startswith(prefix):
+                pdf_url = template.format(doi=doi, suffix=doi.split('/', 1)[1])
+                self.logger.info(f"  → Trying DOI-based publisher pattern: {pdf_url[:80]}")
                 return pdf_url
-        
-        # PLOS (plos.org, plosone.org)
-        elif "plos" in url_lower:
-            # Pattern: replace /article/ with /article/file/
-            if "/article/" in url_lower and "file" not in url_lower:
-                pdf_url = url.replace('/article?', '/article/file?').replace('id=', 'id=') + '&type=printable'
-                self.logger.info(f"  → Trying PLOS pattern: {pdf_url[:80]}")
+        return None
+    
+    def _mdpi_pdf_url(self, url: str, url_lower: str, doi: str) -> Optional[str]:
+        # Pattern: https://www.mdpi.com/XXXX/pdf
+        if "/pdf" not in url_lower:
+            pdf_url = url.rstrip('/') + '/pdf'
+            self.logger.info(f"  → Trying MDPI pattern: {pdf_url[:80]}")
+            return pdf_url
+        return None
+    
+    def _frontiers_pdf_url(self, url: str, url_lower: str, doi: str) -> Optional[str]:
+        # Pattern: add /pdf to the end
+        if "/pdf" not in url_lower and "/full" in url_lower:
+            pdf_url = url.replace('/full', '/pdf')
+            self.logger.info(f"  → Trying Frontiers pattern: {pdf_url[:80]}")
+            return pdf_url
+        return None
+    
+    def _nature_pdf_url(self, url: str, url_lower: str, doi: str) -> Optional[str]:
+        # Pattern: replace /articles/ with /articles/
+        if ".pdf" not in url_lower:
+            pdf_url = url.rstrip('/') + '.pdf'
+            self.logger.info(f"  → Trying Nature pattern: {pdf_url[:80]}")
+            return pdf_url
+        return None
+    
+    def _ieee_pdf_url(self, url: str, url_lower: str, doi: str) -> Optional[str]:
+        # Extract document ID and try to build PDF URL
+        match = _IEEE_DOCUMENT_RE.search(url)
+        if match:
+            doc_id = match.group(1)
+            pdf_url = f"https://ieeexplore.ieee.org/stampPDF/getPDF.jsp?tp=&arnumber={doc_id}"
+            self.logger.info(f"  → Trying IEEE pattern: {pdf_url[:80]}")
+            return pdf_url
+        return None
+    
+    def _sciencedirect_pdf_url(self, url: str, url_lower: str, doi: str) -> Optional[str]:
+        # Try to use DOI-based PDF access
+        if doi:
+            # Pattern: https://www.sciencedirect.com/science/article/pii/XXXXX/pdfft
+            if "/pii/" in url_lower:
+                pdf_url = url.split('?')[0].rstrip('/') + '/pdfft?isDTMRedir=true&download=true'
+                self.logger.info(f"  → Trying ScienceDirect pattern: {pdf_url[:80]}")
                 return pdf_url
-        
+        return None
+    
+    def _springer_pdf_url(self, url: str, url_lower: str, doi: str) -> Optional[str]:
+        if "/chapter/" in url_lower or "/article/" in url_lower:
+            # Try adding .pdf extension
+            pdf_url = url.split('?')[0].rstrip('/') + '.pdf'
+            self.logger.info(f"  → Trying Springer pattern: {pdf_url[:80]}")
+            return pdf_url
+        return None
+    
+    def _plos_pdf_url(self, url: str, url_lower: str, doi: str) -> Optional[str]:
+        # Pattern: replace /article/ with /article/file/
+        if "/article/" in url_lower and "file" not in url_lower:
+            pdf_url = url.replace('/article?', '/article/file?').replace('id=', 'id=') + '&type=printable'
+            self.logger.info(f"  → Trying PLOS pattern: {pdf_url[:80]}")
+            return pdf_url
         return None
 
     def _try_scrape_pdf_link(self, url: str) -> Optional[str]:
@@ -710,41 +1332,15 @@ class PaperDownloader:
         Works for many open access repositories and publishers.
         Enhanced with more patterns and better error handling.
         """
-        import requests
-        from bs4 import BeautifulSoup
-        
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            r = requests.get(url, timeout=15, headers=headers)
+            r = self._get(url, timeout=15, headers=_HTML_REQUEST_HEADERS)
             if r.status_code != 200:
                 return None
             
             soup = BeautifulSoup(r.content, 'html.parser')
             
             # Aggressively search for PDFs in different formats
-            pdf_patterns = [
-                # Direct PDF links
-                {'name': 'a', 'href': lambda x: x and x.endswith('.pdf')},
-                {'name': 'a', 'href': lambda x: x and '.pdf' in x.lower()},
-                # Download buttons with "PDF", "download", "full text"
-                {'name': 'a', 'string': lambda x: x and any(w in str(x).lower() for w in ['pdf', 'download', 'full text', 'full-text'])},
-                {'name': 'button', 'string': lambda x: x and any(w in str(x).lower() for w in ['pdf', 'download', 'full text'])},
-                {'name': 'a', 'class_': lambda x: x and any(c in str(x).lower() for c in ['pdf', 'download', 'fulltext'])},
-                # Meta tags for PDF
-                {'name': 'meta', 'attrs': {'name': 'citation_pdf_url'}},
-                {'name': 'meta', 'attrs': {'property': 'og:pdf'}},
-                # Publisher specific
-                {'name': 'a', 'attrs': {'title': lambda x: x and 'PDF' in str(x)}},
-                {'name': 'a', 'attrs': {'data-track-action': 'download pdf'}},
-                {'name': 'a', 'attrs': {'href': lambda x: x and 'pdf' in x.lower() and 'download' in x.lower()}},
-            ]
-            
-            for pattern in pdf_patterns:
+            for pattern in _SCRAPE_TAG_PATTERNS:
                 if 'attrs' in pattern and isinstance(pattern.get('attrs', {}), dict):
                     if any(callable(v) for v in pattern['attrs'].values()):
                         # Skip patterns with callables in attrs
@@ -755,31 +1351,23 @@ class PaperDownloader:
                         if tag and tag.get('content'):
                             pdf_url = tag['content']
                             if pdf_url and not pdf_url.startswith('http'):
-                                from urllib.parse import urljoin
                                 pdf_url = urljoin(url, pdf_url)
                             return pdf_url
                 else:
                     # Link patterns
-                    tags = soup.find_all(pattern['name'], **{k: v for k, v in pattern.items() if k != 'name'})
+                    tags = soup.find_all(pattern['name'], **pattern['kwargs'])
                     for tag in tags:
                         href = tag.get('href')
                         if href:
                             if not href.startswith('http'):
-                                from urllib.parse import urljoin
                                 href = urljoin(url, href)
                             if '.pdf' in href.lower():
                                 return href
             
             # Check JavaScript PDF links (common in modern sites)
-            import re
             # Look for URLs in script tags
-            js_pdf_patterns = [
-                r'https?://[^"\'\s<>]+\.pdf',
-                r'"url":\s*"([^"]+\.pdf[^"]*)"',
-                r'pdfUrl["\']?\s*[:=]\s*["\']([^"\']+\.pdf[^"\']*)["\']',
-            ]
-            for pattern in js_pdf_patterns:
-                matches = re.findall(pattern, r.text)
+            for pattern in _SCRAPE_JS_PDF_PATTERNS:
+                matches = pattern.findall(r.text)
                 if matches:
                     return matches[0]
             
@@ -788,7 +1376,7 @@ class PaperDownloader:
             
             # ACM Digital Library: Construct PDF URL
             if 'dl.acm.org' in url_lower:
-                match = re.search(r'/doi/(?:abs/)?(\d+\.\d+/\d+)', url)
+                match = _ACM_DOI_RE.search(url)
                 if match:
                     doi = match.group(1)
                     pdf_url = f"https://dl.acm.org/doi/pdf/{doi}"
@@ -802,7 +1390,7 @@ class PaperDownloader:
             
             # IEEE Xplore: Try PDF endpoint
             if 'ieeexplore.ieee.org' in url_lower:
-                match = re.search(r'/document/(\d+)', url)
+                match = _IEEE_DOCUMENT_RE.search(url)
                 if match:
                     doc_id = match.group(1)
                     pdf_url = f"https://ieeexplore.ieee.org/stampPDF/getPDF.jsp?tp=&arnumber={doc_id}"
@@ -814,7 +1402,6 @@ class PaperDownloader:
                     href = link.get('href', '')
                     if any(x in href.lower() for x in ['download', 'bitstream', 'pdf', 'fulltext']):
                         if not href.startswith('http'):
-                            from urllib.parse import urljoin
                             href = urljoin(url, href)
                         if '.pdf' in href.lower():
                             return href
@@ -863,11 +1450,13 @@ class PaperDownloader:
             self.logger.info("Try updating scihub library or using an alternative implementation")
         except Exception as e:
             self.logger.error(f"Sci-Hub error for DOI {doi}: {e}")
+            self._note_transient_error(f"scihub:{doi}")
         
         return None
 
     def _safe_filename(self, name: str) -> str:
-        return "".join(c if c.isalnum() else "_" for c in name)[:80]
+        # One character in, one character out, so truncating first is safe
+        return _UNSAFE_FILENAME_CHAR_RE.sub("_", name[:80])
     
     def _store_failed_paper(self, entry: dict):
         """
@@ -876,21 +1465,6 @@ class PaperDownloader:
         Args:
             entry: BibTeX entry dictionary
         """
-        from datetime import date
-        
-        # Import Paper model (assuming it's in src.models)
-        try:
-            import sys
-            from pathlib import Path
-            # Add src to path if not already there
-            src_path = Path(__file__).parent.parent
-            if str(src_path) not in sys.path:
-                sys.path.insert(0, str(src_path))
-            from models import Paper
-        except ImportError:
-            self.logger.error("Failed to import Paper model - cannot store failed papers")
-            return
-        
         try:
             # Extract fields from bibtex entry
             title = entry.get("title") or entry.get("TI") or "Unknown"
@@ -949,14 +1523,15 @@ class PaperDownloader:
         self.logger.info(f"Total papers: {self.stats['total']}")
         self.logger.info(f"Successfully downloaded: {self.stats['success']} ({self.stats['success']/max(self.stats['total'],1)*100:.1f}%)")
         self.logger.info(f"Already downloaded (skipped): {self.stats['skipped']}")
+        if self.stats['duplicates'] > 0:
+            self.logger.info(f"Duplicate entries: {self.stats['duplicates']}")
         self.logger.info(f"Failed to download: {self.stats['failed']} ({self.stats['failed']/max(self.stats['total'],1)*100:.1f}%)")
         if self.stats.get('dois_found', 0) > 0:
             self.logger.info(f"DOIs found via Crossref: {self.stats['dois_found']}")
         self.logger.info("")
         self.logger.info("Downloads by method:")
-        for method, count in self.stats['by_method'].items():
-            if count > 0:
-                self.logger.info(f"  {method.replace('_', ' ').title()}: {count}")
+        for method, count in self.stats['by_method'].most_common():
+            self.logger.info(f"  {method.replace('_', ' ').title()}: {count}")
         self.logger.info("="*80)
         self.logger.info("")
 
@@ -22,7 +22,8 @@ class PubMedSearcher:
     SEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
     FETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
     
-    def __init__(self, email: str, api_key: Optional[str] = None, max_results: int = 1000, timeout: int = 30):
+    def __init__(self, email: str, api_key: Optional[str] = None, max_results: int = 1000, timeout: int = 30,
+                 session: Optional[requests.Session] = None):
         """
         Initialize PubMed searcher.
         
@@ -31,6 +32,7 @@ class PubMedSearcher:
             api_key: PubMed API key (optional, increases rate limits)
             max_results: Maximum number of results to fetch
             timeout: Request timeout in seconds
+            session: Shared HTTP session (creates a new one if None)
         """
         if not email:
             raise ValueError("Email is required for PubMed API (NCBI policy)")
@@ -39,7 +41,7 @@ class PubMedSearcher:
         self.api_key = api_key
         self.max_results = max_results
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = session or requests.Session()
         
         # Rate limiting: 3 requests/sec without key, 10 with key
         self.delay = 0.1 if api_key else 0.34
@@ -302,9 +304,9 @@ class PubMedSearcher:
             # Keywords
             keywords_list = medline_citation.find(".//KeywordList")
             if keywords_list is not None:
-                for keyword in keywords_list.findall(".//Keyword"):
-                    if keyword.text:
-                        paper.keywords.add(keyword.text.strip())
+                paper.add_keywords(
+                    keyword.text.strip() for keyword in keywords_list.findall(".//Keyword") if keyword.text
+                )
             
             # URL
             if paper.pmid:
@@ -20,7 +20,8 @@ class ScopusSearcher:
     BASE_URL = "https://api.elsevier.com/content/search/scopus"
     ABSTRACT_URL = "https://api.elsevier.com/content/abstract/scopus_id"
     
-    def __init__(self, api_key: str, max_results: int = 1000, timeout: int = 30, fetch_abstracts: bool = True):
+    def __init__(self, api_key: str, max_results: int = 1000, timeout: int = 30, fetch_abstracts: bool = True,
+                 session: Optional[requests.Session] = None):
         """
         Initialize Scopus searcher.
         
@@ -29,6 +30,7 @@ class ScopusSearcher:
             max_results: Maximum number of results to fetch
             timeout: Request timeout in seconds
             fetch_abstracts: Whether to fetch abstracts (requires additional API calls)
+            session: Shared HTTP session (creates a new one if None)
         """
         if not api_key:
             raise ValueError("Scopus API key is required")
@@ -37,7 +39,7 @@ class ScopusSearcher:
         self.max_results = max_results
         self.timeout = timeout
         self.fetch_abstracts = fetch_abstracts
-        self.session = requests.Session()
+        self.session = session or requests.Session()
     
     def search(self, query: str, year_from: Optional[int] = None, year_to: Optional[int] = None) -> List[Paper]:
         """
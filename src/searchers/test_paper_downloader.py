@@ -7,8 +7,9 @@ import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
-sys.path.insert(0, str(Path(__file__).parent))
-from paper_downloader import PaperDownloader
+# Import through the src package (run from anywhere)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from src.searchers.paper_downloader import PaperDownloader
 
 # Load environment variables from .env in parent directory
 env_path = Path(__file__).parent.parent / ".env"
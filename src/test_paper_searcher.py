@@ -0,0 +1,96 @@
+"""
+Tests for PaperSearcher deduplication: exact and fuzzy title matching,
+the number/identifier veto, and the index state after a conflict split.
+
+Run from the repository root with: python -m pytest src/test_paper_searcher.py
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import src.paper_searcher as paper_searcher
+from src.models import Paper
+from src.paper_searcher import PaperSearcher
+
+
+@pytest.fixture(params=[True, False], ids=["rapidfuzz", "difflib"])
+def searcher(request, monkeypatch):
+    """PaperSearcher using rapidfuzz (if installed) or the difflib fallback"""
+    if request.param and not paper_searcher.RAPIDFUZZ_AVAILABLE:
+        pytest.skip("rapidfuzz not installed")
+    monkeypatch.setattr(paper_searcher, "RAPIDFUZZ_AVAILABLE", request.param)
+    with PaperSearcher() as s:
+        yield s
+
+
+def test_near_duplicate_titles_merge(searcher):
+    searcher._add_papers([
+        Paper("A deep learning approach for EEG seizure detection in children", doi="10.1/eeg"),
+        Paper("A deep-learning approach for EEG seizure detections in children", pmid="123"),
+    ])
+
+    assert len(searcher.papers) == 1
+    paper, = searcher.papers.values()
+    assert (paper.doi, paper.pmid) == ("10.1/eeg", "123")
+
+
+def test_titles_differing_in_part_number_stay_separate(searcher):
+    searcher._add_papers([
+        Paper("Seizure forecasting with wearable devices, part 1"),
+        Paper("Seizure forecasting with wearable devices, part 2"),
+    ])
+
+    assert len(searcher.papers) == 2
+
+
+def test_titles_differing_in_year_stay_separate(searcher):
+    searcher._add_papers([
+        Paper("Global burden of neurological disorders in adolescents: 2017 report"),
+        Paper("Global burden of neurological disorders in adolescents: 2019 report"),
+    ])
+
+    assert len(searcher.papers) == 2
+
+
+@pytest.mark.parametrize("field", ["doi", "pmid", "arxiv_id"])
+def test_same_title_with_conflicting_identifiers_splits(searcher, field):
+    searcher._add_papers([
+        Paper("Editorial", **{field: "1"}),
+        Paper("Editorial", **{field: "2"}),
+    ])
+
+    assert len(searcher.papers) == 2
+    assert {getattr(p, field) for p in searcher.papers.values()} == {"1", "2"}
+
+
+def test_near_duplicate_with_conflicting_dois_splits(searcher):
+    searcher._add_papers([
+        Paper("A deep learning approach for EEG seizure detection in children", doi="10.1/a"),
+        Paper("A deep-learning approach for EEG seizure detections in children", doi="10.1/b"),
+    ])
+
+    assert len(searcher.papers) == 2
+
+
+def test_index_state_after_split(searcher):
+    first = Paper("Editorial", doi="10.1/a")
+    second = Paper("Editorial", doi="10.1/b")
+    searcher._add_papers([first, second])
+
+    first_key = searcher._by_doi["10.1/a"]
+    second_key = searcher._by_doi["10.1/b"]
+    assert first_key != second_key
+    assert searcher.papers[first_key] is first
+    assert searcher.papers[second_key] is second
+
+    # The title stays indexed (and blocked) once, on the first record
+    assert searcher._by_title["editorial"] == first_key
+    assert searcher._blocks["editorial"] == ["editorial"]
+
+    # Later records find their entry by identifier, title-only ones the first record
+    searcher._add_papers([Paper("Editorial", doi="10.1/b", pmid="7"), Paper("Editorial", journal="J")])
+    assert len(searcher.papers) == 2
+    assert second.pmid == "7"
+    assert first.journal == "J"
@@ -4,6 +4,7 @@ Utility functions for loading and saving papers.
 
 import logging
 import csv
+import re
 from pathlib import Path
 from datetime import date, datetime
 from typing import List, Dict, Set, Any
@@ -13,6 +14,9 @@ from .models import Paper
 
 logger = logging.getLogger(__name__)
 
+# Undoes the escaping Paper.to_bibtex_entry applies to abstracts
+_BIB_ESCAPED_CHAR_RE = re.compile(r'(?<!\\)\\([%&$#_])')
+
 
 def load_papers_from_bib(bib_file: Path) -> List[Paper]:
     """
@@ -62,7 +66,7 @@ def load_papers_from_bib(bib_file: Path) -> List[Paper]:
                         elif field == 'author':
                             authors = [a.strip() for a in value.split(' and ')]
                         elif field == 'abstract':
-                            abstract = value
+                            abstract = _BIB_ESCAPED_CHAR_RE.sub(r'\1', value)
                         elif field == 'doi':
                             doi = value
                         elif field == 'pmid':